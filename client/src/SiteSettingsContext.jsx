@@ -12,7 +12,7 @@ export const SiteSettingsProvider = ({ children }) => {
 
   const refreshSettings = async () => {
     try {
-      const response = await axios.get(`${API_BASE_URL}/settings/public`);
+      const response = await axios.get(`${API_BASE_URL}/settings/public?limit=3`);
       setSettings(response.data);
     } catch (error) {
       console.error("Failed to load site settings", error);
@@ -3,14 +3,23 @@ import axios from "axios";
 import { AuthContext } from "../AuthContext";
 import { SiteSettingsContext } from "../SiteSettingsContext";
 
+// Page size for the cursor-paginated admin lists.
+const ADMIN_PAGE_SIZE = 50;
+
 const AdminDashboard = () => {
   const { user, token, logout } = useContext(AuthContext);
   const { refreshSettings } = useContext(SiteSettingsContext);
   const [activeTab, setActiveTab] = useState("bookings");
   const [bookings, setBookings] = useState([]);
+  const [bookingsCursor, setBookingsCursor] = useState(null);
+  // Server-side totals; the lists above only hold the pages loaded so far.
+  const [dashboardCounts, setDashboardCounts] = useState(null);
+  const [loadingMore, setLoadingMore] = useState("");
   const [contacts, setContacts] = useState([]);
+  const [contactsCursor, setContactsCursor] = useState(null);
   const [services, setServices] = useState([]);
   const [portfolio, setPortfolio] = useState([]);
+  const [portfolioCursor, setPortfolioCursor] = useState(null);
   const [hardwareCategories, setHardwareCategories] = useState([]);
   const [teamMembers, setTeamMembers] = useState([]);
   const [siteSettings, setSiteSettings] = useState({
@@ -262,24 +271,31 @@ const AdminDashboard = () => {
           },
         };
 
+        refreshCounts();
+
         await apiCallWithRetry(async () => {
           switch (activeTab) {
             case "bookings":
               const [bookingsRes, bookingsTeamRes, bookingServicesRes] = await Promise.all([
-                axios.get("https://radamconstruction.onrender.com/bookings", config),
+                axios.get(
+                  `https://radamconstruction.onrender.com/bookings?limit=${ADMIN_PAGE_SIZE}`,
+                  config
+                ),
                 axios.get("https://radamconstruction.onrender.com/users", config),
                 axios.get("https://radamconstruction.onrender.com/services"),
               ]);
-              setBookings(bookingsRes.data);
+              setBookings(bookingsRes.data.items);
+              setBookingsCursor(bookingsRes.data.next_cursor);
               setTeamMembers(bookingsTeamRes.data);
               setServices(bookingServicesRes.data);
               break;
             case "contacts":
               const contactsRes = await axios.get(
-                "https://radamconstruction.onrender.com/contacts",
+                `https://radamconstruction.onrender.com/contacts?limit=${ADMIN_PAGE_SIZE}`,
                 config
               );
-              setContacts(contactsRes.data);
+              setContacts(contactsRes.data.items);
+              setContactsCursor(contactsRes.data.next_cursor);
               break;
             case "services":
               const servicesRes = await axios.get(
@@ -289,9 +305,10 @@ const AdminDashboard = () => {
               break;
             case "portfolio":
               const portfolioRes = await axios.get(
-                "https://radamconstruction.onrender.com/portfolio"
+                `https://radamconstruction.onrender.com/portfolio?limit=${ADMIN_PAGE_SIZE}`
               );
-              setPortfolio(portfolioRes.data);
+              setPortfolio(portfolioRes.data.items);
+              setPortfolioCursor(portfolioRes.data.next_cursor);
               break;
             case "hardware":
               const hardwareRes = await axios.get(
@@ -340,6 +357,78 @@ const AdminDashboard = () => {
     fetchData();
   }, [activeTab, token, logout]);
 
+  const refreshCounts = async () => {
+    if (!token) return;
+
+    try {
+      const response = await axios.get(
+        "https://radamconstruction.onrender.com/dashboard/counts",
+        { headers: { Authorization: `Bearer ${token}` } }
+      );
+      setDashboardCounts(response.data);
+    } catch (error) {
+      console.error("Error fetching dashboard counts:", error);
+    }
+  };
+
+  // Appends the next cursor page of a list; ids already shown are skipped.
+  const loadNextPage = async ({ key, url, cursor, setItems, setCursor, authenticated = true }) => {
+    if (!cursor || loadingMore) return;
+    if (authenticated && !validateAuth()) return;
+
+    setLoadingMore(key);
+    try {
+      const separator = url.includes("?") ? "&" : "?";
+      const response = await axios.get(
+        `${url}${separator}limit=${ADMIN_PAGE_SIZE}&cursor=${encodeURIComponent(cursor)}`,
+        authenticated ? { headers: { Authorization: `Bearer ${token}` } } : undefined
+      );
+      setItems((current) => {
+        const seen = new Set(current.map((item) => item.id));
+        return [...current, ...response.data.items.filter((item) => !seen.has(item.id))];
+      });
+      setCursor(response.data.next_cursor);
+    } catch (error) {
+      console.error(`Error loading more ${key}:`, error);
+      if (error.response?.status === 401) {
+        showMessage("Session expired. Please log in again.", "error");
+        logout();
+      } else {
+        showMessage(`Error loading more ${key}`, "error");
+      }
+    } finally {
+      setLoadingMore("");
+    }
+  };
+
+  const loadMoreBookings = () =>
+    loadNextPage({
+      key: "bookings",
+      url: "https://radamconstruction.onrender.com/bookings",
+      cursor: bookingsCursor,
+      setItems: setBookings,
+      setCursor: setBookingsCursor,
+    });
+
+  const loadMoreContacts = () =>
+    loadNextPage({
+      key: "contacts",
+      url: "https://radamconstruction.onrender.com/contacts",
+      cursor: contactsCursor,
+      setItems: setContacts,
+      setCursor: setContactsCursor,
+    });
+
+  const loadMorePortfolio = () =>
+    loadNextPage({
+      key: "portfolio",
+      url: "https://radamconstruction.onrender.com/portfolio",
+      cursor: portfolioCursor,
+      setItems: setPortfolio,
+      setCursor: setPortfolioCursor,
+      authenticated: false,
+    });
+
   const showMessage = (text, type) => {
     setMessage({ text, type });
     setTimeout(() => setMessage({ text: "", type: "" }), 4000);
@@ -470,9 +559,10 @@ const AdminDashboard = () => {
       setNewPortfolio({ title: "", description: "", images: [], alt_text: "" });
 
       const portfolioRes = await axios.get(
-        "https://radamconstruction.onrender.com/portfolio"
+        `https://radamconstruction.onrender.com/portfolio?limit=${ADMIN_PAGE_SIZE}`
       );
-      setPortfolio(portfolioRes.data);
+      setPortfolio(portfolioRes.data.items);
+      setPortfolioCursor(portfolioRes.data.next_cursor);
     } catch (error) {
       console.error("Error creating portfolio item:", error);
       if (error.response?.status === 401) {
@@ -574,6 +664,7 @@ const AdminDashboard = () => {
             booking.id === id ? { ...booking, is_read: true } : booking
           )
         );
+        refreshCounts();
       }
 
       if (type === "contact") {
@@ -587,6 +678,7 @@ const AdminDashboard = () => {
             contact.id === id ? { ...contact, is_read: true } : contact
           )
         );
+        refreshCounts();
       }
     } catch (error) {
       console.error(`Error marking ${type} as read:`, error);
@@ -640,6 +732,7 @@ const AdminDashboard = () => {
           break;
         case "contact":
           setContacts(contacts.filter((item) => item.id !== id));
+          refreshCounts();
           break;
         case "hardware-category":
         case "hardware-item":
@@ -991,6 +1084,21 @@ const AdminDashboard = () => {
     </div>
   );
 
+  // "Load more" footer for cursor-paginated lists
+  const LoadMoreButton = ({ cursor, loadingKey, onClick }) =>
+    cursor ? (
+      <div className="flex justify-center p-4 border-t border-gray-200">
+        <button
+          type="button"
+          onClick={onClick}
+          disabled={Boolean(loadingMore)}
+          className="px-5 py-2 text-sm font-medium text-blue-600 border border-blue-200 rounded-lg hover:bg-blue-50 transition-colors duration-200 disabled:opacity-50 disabled:cursor-not-allowed"
+        >
+          {loadingMore === loadingKey ? "Loading..." : "Load more"}
+        </button>
+      </div>
+    ) : null;
+
   const navTabs = [
     { id: "bookings", label: "Bookings", tone: "from-sky-500 to-blue-600" },
     { id: "contacts", label: "Contacts", tone: "from-emerald-500 to-teal-600" },
@@ -1004,9 +1112,13 @@ const AdminDashboard = () => {
   const activeTabMeta =
     navTabs.find((tab) => tab.id === activeTab) || navTabs[0];
 
+  const totalBookingsCount = dashboardCounts?.bookings?.total ?? bookings.length;
+
+  const totalContactsCount = dashboardCounts?.contacts?.total ?? contacts.length;
+
   const totalManagedItems =
-    bookings.length +
-    contacts.length +
+    totalBookingsCount +
+    totalContactsCount +
     services.length +
     portfolio.length +
     teamMembers.length +
@@ -1018,12 +1130,12 @@ const AdminDashboard = () => {
   const summaryCards = [
     {
       label: "Bookings",
-      value: bookings.length,
+      value: totalBookingsCount,
       helper: "Incoming quote and site visit requests",
     },
     {
       label: "Contacts",
-      value: contacts.length,
+      value: totalContactsCount,
       helper: "Direct messages from the contact form",
     },
     {
@@ -1046,8 +1158,12 @@ const AdminDashboard = () => {
     },
   ];
 
-  const unreadBookingsCount = bookings.filter((booking) => !booking.is_read).length;
-  const unreadContactsCount = contacts.filter((contact) => !contact.is_read).length;
+  const unreadBookingsCount =
+    dashboardCounts?.bookings?.unread ??
+    bookings.filter((booking) => !booking.is_read).length;
+  const unreadContactsCount =
+    dashboardCounts?.contacts?.unread ??
+    contacts.filter((contact) => !contact.is_read).length;
   const filteredBookings = bookings.filter((booking) => {
     const searchText = bookingFilters.search.trim().toLowerCase();
     const matchesSearch =
@@ -1198,7 +1314,7 @@ const AdminDashboard = () => {
             <div className="bg-white rounded-xl shadow-sm border border-gray-200 overflow-hidden">
               <div className="p-4 sm:p-6 border-b border-gray-200">
                 <h3 className="text-lg font-semibold text-gray-800">
-                  Booking Requests ({bookings.length})
+                  Booking Requests ({totalBookingsCount})
                 </h3>
                 <div className="mt-4 grid gap-3 md:grid-cols-2 xl:grid-cols-4">
                   <input
@@ -1465,6 +1581,11 @@ const AdminDashboard = () => {
                   ))
                 )}
               </div>
+              <LoadMoreButton
+                cursor={bookingsCursor}
+                loadingKey="bookings"
+                onClick={loadMoreBookings}
+              />
             </div>
           )}
 
@@ -1473,7 +1594,7 @@ const AdminDashboard = () => {
             <div className="bg-white rounded-xl shadow-sm border border-gray-200 overflow-hidden">
               <div className="p-4 sm:p-6 border-b border-gray-200">
                 <h3 className="text-lg font-semibold text-gray-800">
-                  Contact Messages ({contacts.length})
+                  Contact Messages ({totalContactsCount})
                 </h3>
                 <div className="mt-4 grid gap-3 md:grid-cols-2">
                   <input
@@ -1648,6 +1769,11 @@ const AdminDashboard = () => {
                   ))
                 )}
               </div>
+              <LoadMoreButton
+                cursor={contactsCursor}
+                loadingKey="contacts"
+                onClick={loadMoreContacts}
+              />
             </div>
           )}
 
@@ -2185,6 +2311,11 @@ const AdminDashboard = () => {
                     ))}
                   </div>
                 )}
+                <LoadMoreButton
+                  cursor={portfolioCursor}
+                  loadingKey="portfolio"
+                  onClick={loadMorePortfolio}
+                />
               </div>
             </div>
           )}
@@ -2904,8 +3035,8 @@ const AdminDashboard = () => {
                 <div className="min-w-0 flex-1">
                   <span className="block text-sm font-semibold leading-tight">{tab.label}</span>
                   <span className={`block truncate text-[10px] ${activeTab === tab.id ? "text-slate-300" : "text-slate-400"}`}>
-                    {tab.id === "bookings" && `${unreadBookingsCount} new · ${bookings.length} total`}
-                    {tab.id === "contacts" && `${unreadContactsCount} new · ${contacts.length} total`}
+                    {tab.id === "bookings" && `${unreadBookingsCount} new · ${totalBookingsCount} total`}
+                    {tab.id === "contacts" && `${unreadContactsCount} new · ${totalContactsCount} total`}
                     {tab.id === "services" && `${services.length} services`}
                     {tab.id === "portfolio" && `${portfolio.length} projects`}
                     {tab.id === "hardware" && `${hardwareCategories.length} categories`}
@@ -63,11 +63,11 @@ export default function HomePage() {
       .finally(() => setIsLoadingServices(false));
 
     axios
-      .get(`${API_BASE_URL}/portfolio`)
+      .get(`${API_BASE_URL}/portfolio?limit=3`)
       .then((response) => {
         const data = Array.isArray(response.data)
           ? response.data
-          : response.data.portfolio || [];
+          : response.data.items || [];
         setPortfolio(data.slice(0, 3));
       })
       .catch((error) => console.error("Failed to fetch portfolio", error))
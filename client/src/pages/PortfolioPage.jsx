@@ -2,6 +2,8 @@ import React, { useState, useEffect } from "react";
 import axios from "axios";
 import { PortfolioCardSkeleton } from "../components/Skeleton";
 
+const PORTFOLIO_PAGE_SIZE = 24;
+
 const PortfolioPage = () => {
   const [portfolioItems, setPortfolioItems] = useState([]);
   const [loading, setLoading] = useState(true);
@@ -10,14 +12,19 @@ const PortfolioPage = () => {
   const [currentImageIndex, setCurrentImageIndex] = useState(0);
   const [cardImageIndexes, setCardImageIndexes] = useState({});
   const [error, setError] = useState(null);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
-  useEffect(() => {
-    axios
-      .get("https://radamconstruction.onrender.com/portfolio")
+  const fetchPortfolioPage = (cursor = null) => {
+    const params = new URLSearchParams({ limit: PORTFOLIO_PAGE_SIZE });
+    if (cursor) params.set("cursor", cursor);
+
+    return axios
+      .get(`https://radamconstruction.onrender.com/portfolio?${params}`)
       .then((response) => {
         const data = Array.isArray(response.data)
           ? response.data
-          : response.data.portfolio || [];
+          : response.data.items || [];
         
         // Transform the data to match expected structure
         const transformedData = data.map(item => ({
@@ -30,22 +37,39 @@ const PortfolioPage = () => {
           ].filter(Boolean) // Remove any null/undefined values
         }));
         
-        setPortfolioItems(transformedData);
-        setCardImageIndexes(
+        setPortfolioItems((current) => {
+          const seen = new Set(current.map((item) => item.id));
+          return [...current, ...transformedData.filter((item) => !seen.has(item.id))];
+        });
+        setCardImageIndexes((current) =>
           transformedData.reduce((accumulator, item) => {
-            accumulator[item.id] = 0;
+            accumulator[item.id] = current[item.id] || 0;
             return accumulator;
-          }, {})
+          }, { ...current })
         );
-        setLoading(false);
-      })
+        setNextCursor(response.data.next_cursor || null);
+      });
+  };
+
+  useEffect(() => {
+    fetchPortfolioPage()
       .catch((error) => {
         console.error("Error fetching portfolio:", error);
         setError("Failed to load portfolio. Please try again later.");
-        setLoading(false);
-      });
+      })
+      .finally(() => setLoading(false));
   }, []);
 
+  const loadMoreProjects = () => {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    fetchPortfolioPage(nextCursor)
+      .catch((error) => {
+        console.error("Error fetching more portfolio items:", error);
+      })
+      .finally(() => setLoadingMore(false));
+  };
+
   // Extract unique categories (adjust based on your actual category field)
   const categories = ["all", ...new Set(portfolioItems.map(item => item.category).filter(Boolean))];
 
@@ -290,6 +314,18 @@ const PortfolioPage = () => {
               ))}
             </div>
           )}
+
+          {!error && !loading && nextCursor && (
+            <div className="mt-8 flex justify-center">
+              <button
+                onClick={loadMoreProjects}
+                disabled={loadingMore}
+                className="px-6 py-2 bg-blue-600 text-white rounded hover:bg-blue-700 disabled:opacity-50 disabled:cursor-not-allowed"
+              >
+                {loadingMore ? "Loading..." : "Load more projects"}
+              </button>
+            </div>
+          )}
         </div>
       </section>
 
@@ -0,0 +1,39 @@
+"""add uploaded assets
+
+Revision ID: 5b8e2c41d7a9
+Revises: 1d56166c6e04
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "5b8e2c41d7a9"
+down_revision = "1d56166c6e04"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "uploaded_assets",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("secure_url", sa.String(), nullable=False),
+        sa.Column("public_id", sa.String(), nullable=True),
+        sa.Column("format", sa.String(length=20), nullable=True),
+        sa.Column("width", sa.Integer(), nullable=True),
+        sa.Column("height", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_uploaded_assets_content_hash", "uploaded_assets", ["content_hash"], unique=True
+    )
+
+
+def downgrade():
+    op.drop_index("ix_uploaded_assets_content_hash", table_name="uploaded_assets")
+    op.drop_table("uploaded_assets")
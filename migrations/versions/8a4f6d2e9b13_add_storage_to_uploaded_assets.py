@@ -0,0 +1,36 @@
+"""add storage backend to uploaded assets
+
+Revision ID: 8a4f6d2e9b13
+Revises: 5b8e2c41d7a9
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "8a4f6d2e9b13"
+down_revision = "5b8e2c41d7a9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.drop_index("ix_uploaded_assets_content_hash", table_name="uploaded_assets")
+    with op.batch_alter_table("uploaded_assets", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("storage", sa.String(length=20), nullable=False, server_default="cloudinary")
+        )
+        batch_op.create_unique_constraint(
+            "uq_uploaded_assets_storage_hash", ["storage", "content_hash"]
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("uploaded_assets", schema=None) as batch_op:
+        batch_op.drop_constraint("uq_uploaded_assets_storage_hash", type_="unique")
+        batch_op.drop_column("storage")
+    op.create_index(
+        "ix_uploaded_assets_content_hash", "uploaded_assets", ["content_hash"], unique=True
+    )
@@ -0,0 +1,76 @@
+"""add contacts inbox indexes and full-text search
+
+Revision ID: a2c5e8f71d34
+Revises: f1a8d3b6c042
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "a2c5e8f71d34"
+down_revision = "f1a8d3b6c042"
+branch_labels = None
+depends_on = None
+
+
+# Must match CONTACT_SEARCH_VECTOR in server/models/contact.py, or Postgres
+# will not use the index.
+SEARCH_VECTOR = (
+    "to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(email, '') || ' '"
+    " || coalesce(phone, '') || ' ' || coalesce(subject, '') || ' ' || coalesce(message, ''))"
+)
+FTS_COLUMNS = "name, email, phone, subject, message"
+
+
+def upgrade():
+    op.create_index("ix_contacts_created_at_id", "contacts", ["created_at", "id"])
+    op.create_index(
+        "ix_contacts_is_read_created_at_id", "contacts", ["is_read", "created_at", "id"]
+    )
+
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute(f"CREATE INDEX ix_contacts_search ON contacts USING gin ({SEARCH_VECTOR})")
+    elif dialect == "sqlite":
+        # Batch migrations that rebuild the contacts table drop these
+        # triggers; recreate them afterwards.
+        op.execute(
+            f"CREATE VIRTUAL TABLE contacts_fts USING fts5("
+            f"{FTS_COLUMNS}, content='contacts', content_rowid='id')"
+        )
+        op.execute(
+            f"""CREATE TRIGGER contacts_fts_ai AFTER INSERT ON contacts BEGIN
+                INSERT INTO contacts_fts(rowid, {FTS_COLUMNS})
+                VALUES (new.id, new.name, new.email, new.phone, new.subject, new.message);
+            END"""
+        )
+        op.execute(
+            f"""CREATE TRIGGER contacts_fts_ad AFTER DELETE ON contacts BEGIN
+                INSERT INTO contacts_fts(contacts_fts, rowid, {FTS_COLUMNS})
+                VALUES ('delete', old.id, old.name, old.email, old.phone, old.subject, old.message);
+            END"""
+        )
+        op.execute(
+            f"""CREATE TRIGGER contacts_fts_au AFTER UPDATE OF {FTS_COLUMNS} ON contacts BEGIN
+                INSERT INTO contacts_fts(contacts_fts, rowid, {FTS_COLUMNS})
+                VALUES ('delete', old.id, old.name, old.email, old.phone, old.subject, old.message);
+                INSERT INTO contacts_fts(rowid, {FTS_COLUMNS})
+                VALUES (new.id, new.name, new.email, new.phone, new.subject, new.message);
+            END"""
+        )
+        op.execute("INSERT INTO contacts_fts(contacts_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_contacts_search")
+    elif dialect == "sqlite":
+        for trigger in ("contacts_fts_au", "contacts_fts_ad", "contacts_fts_ai"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS contacts_fts")
+
+    op.drop_index("ix_contacts_is_read_created_at_id", table_name="contacts")
+    op.drop_index("ix_contacts_created_at_id", table_name="contacts")
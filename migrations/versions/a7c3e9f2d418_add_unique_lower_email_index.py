@@ -0,0 +1,40 @@
+"""normalize user emails and add a unique index on lower(email)
+
+Revision ID: a7c3e9f2d418
+Revises: f5b8d1e4a637
+Create Date: 2026-10-19 23:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a7c3e9f2d418"
+down_revision = "f5b8d1e4a637"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    connection = op.get_bind()
+    duplicates = connection.execute(
+        sa.text(
+            "SELECT lower(trim(email)) AS email, COUNT(*) FROM users "
+            "GROUP BY lower(trim(email)) HAVING COUNT(*) > 1"
+        )
+    ).all()
+    if duplicates:
+        # Merging accounts would reassign bookings, so leave that to a person.
+        emails = ", ".join(row.email for row in duplicates)
+        raise RuntimeError(
+            f"Users share an email when case and spaces are ignored: {emails}. "
+            "Remove or rename the duplicates, then run the upgrade again."
+        )
+
+    op.execute("UPDATE users SET email = lower(trim(email)) WHERE email != lower(trim(email))")
+    op.create_index("uq_users_email_lower", "users", [sa.text("lower(email)")], unique=True)
+
+
+def downgrade():
+    op.drop_index("uq_users_email_lower", table_name="users")
@@ -0,0 +1,27 @@
+"""index sync tombstones by deleted_at for time-keyed sync
+
+Revision ID: b1e6f4a9c352
+Revises: a7c3e9f2d418
+Create Date: 2026-10-20 10:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "b1e6f4a9c352"
+down_revision = "a7c3e9f2d418"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_sync_tombstones_deleted_at_id", "sync_tombstones", ["deleted_at", "id"]
+    )
+    op.drop_index("ix_sync_tombstones_entity_id", table_name="sync_tombstones")
+
+
+def downgrade():
+    op.create_index("ix_sync_tombstones_entity_id", "sync_tombstones", ["entity", "id"])
+    op.drop_index("ix_sync_tombstones_deleted_at_id", table_name="sync_tombstones")
@@ -0,0 +1,43 @@
+"""add archived records
+
+Revision ID: b6d9f2a4c187
+Revises: a2c5e8f71d34
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b6d9f2a4c187"
+down_revision = "a2c5e8f71d34"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "archived_records",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("entity", sa.String(length=30), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("email", sa.String(length=120), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("archived_at", sa.DateTime(), nullable=False),
+        sa.Column("data", sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("entity", "entity_id", name="uq_archived_records_entity_id"),
+    )
+    op.create_index(
+        "ix_archived_records_entity_created_at_id",
+        "archived_records",
+        ["entity", "created_at", "id"],
+    )
+    op.create_index("ix_archived_records_entity_email", "archived_records", ["entity", "email"])
+
+
+def downgrade():
+    op.drop_index("ix_archived_records_entity_email", table_name="archived_records")
+    op.drop_index("ix_archived_records_entity_created_at_id", table_name="archived_records")
+    op.drop_table("archived_records")
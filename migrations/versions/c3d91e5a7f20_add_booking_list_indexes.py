@@ -0,0 +1,34 @@
+"""add booking list indexes
+
+Revision ID: c3d91e5a7f20
+Revises: 8a4f6d2e9b13
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "c3d91e5a7f20"
+down_revision = "8a4f6d2e9b13"
+branch_labels = None
+depends_on = None
+
+
+BOOKING_INDEXES = {
+    "ix_booking_created_at_id": ["created_at", "id"],
+    "ix_booking_status_created_at_id": ["status", "created_at", "id"],
+    "ix_booking_is_read_created_at_id": ["is_read", "created_at", "id"],
+    "ix_booking_assigned_user_id_created_at_id": ["assigned_user_id", "created_at", "id"],
+    "ix_booking_service_id_created_at_id": ["service_id", "created_at", "id"],
+}
+
+
+def upgrade():
+    for name, columns in BOOKING_INDEXES.items():
+        op.create_index(name, "booking", columns)
+
+
+def downgrade():
+    for name in reversed(list(BOOKING_INDEXES)):
+        op.drop_index(name, table_name="booking")
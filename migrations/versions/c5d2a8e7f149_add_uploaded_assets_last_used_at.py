@@ -0,0 +1,27 @@
+"""track when an uploaded asset was last reused
+
+Revision ID: c5d2a8e7f149
+Revises: b1e6f4a9c352
+Create Date: 2026-10-20 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c5d2a8e7f149"
+down_revision = "b1e6f4a9c352"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("uploaded_assets", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("last_used_at", sa.DateTime(), nullable=True))
+    op.execute("UPDATE uploaded_assets SET last_used_at = created_at")
+
+
+def downgrade():
+    with op.batch_alter_table("uploaded_assets", schema=None) as batch_op:
+        batch_op.drop_column("last_used_at")
@@ -0,0 +1,42 @@
+"""add position to portfolio images
+
+Revision ID: c8e1a5d9f263
+Revises: b6d9f2a4c187
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c8e1a5d9f263"
+down_revision = "b6d9f2a4c187"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("portfolio_images", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("position", sa.Integer(), nullable=False, server_default="0")
+        )
+
+    # Existing galleries keep their insertion order.
+    op.execute(
+        "UPDATE portfolio_images SET position = ("
+        "SELECT COUNT(*) FROM portfolio_images AS earlier "
+        "WHERE earlier.portfolio_id = portfolio_images.portfolio_id "
+        "AND earlier.id < portfolio_images.id)"
+    )
+    op.create_index(
+        "ix_portfolio_images_portfolio_id_position",
+        "portfolio_images",
+        ["portfolio_id", "position"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_portfolio_images_portfolio_id_position", table_name="portfolio_images")
+    with op.batch_alter_table("portfolio_images", schema=None) as batch_op:
+        batch_op.drop_column("position")
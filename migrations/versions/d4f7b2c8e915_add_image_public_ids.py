@@ -0,0 +1,78 @@
+"""store public_id next to every image url
+
+Revision ID: d4f7b2c8e915
+Revises: c8e1a5d9f263
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+import os
+import re
+from urllib.parse import urlparse
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d4f7b2c8e915"
+down_revision = "c8e1a5d9f263"
+branch_labels = None
+depends_on = None
+
+
+# (table, public_id column, url column)
+IMAGE_COLUMNS = (
+    ("service", "image_public_id", "image_url"),
+    ("portfolio_items", "image_public_id", "image_url"),
+    ("portfolio_images", "public_id", "image_url"),
+    ("hardware_items", "image_public_id", "image_url"),
+)
+
+UPLOAD_MARKER = "/image/upload/"
+VERSION_SEGMENT = re.compile(r"(?:^|/)v\d+/(.+)$")
+TRANSFORMATION_SEGMENT = re.compile(r"^[a-z]{1,3}_[^/]*$")
+
+
+def _public_id_from_url(url):
+    # Same parsing as public_id_from_url in server/service/cloudinary_service.py.
+    path = urlparse(url or "").path
+    if UPLOAD_MARKER not in path:
+        return None
+    rest = path.split(UPLOAD_MARKER, 1)[1]
+    versioned = VERSION_SEGMENT.search(rest)
+    if versioned:
+        rest = versioned.group(1)
+    else:
+        segments = rest.split("/")
+        while len(segments) > 1 and TRANSFORMATION_SEGMENT.match(segments[0]):
+            segments.pop(0)
+        rest = "/".join(segments)
+    return os.path.splitext(rest)[0] or None
+
+
+def upgrade():
+    for table, public_id_column, _ in IMAGE_COLUMNS:
+        length = 255 if table == "portfolio_images" else None
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(sa.Column(public_id_column, sa.String(length=length), nullable=True))
+
+    connection = op.get_bind()
+    for table, public_id_column, url_column in IMAGE_COLUMNS:
+        rows = connection.execute(
+            sa.text(f"SELECT id, {url_column} FROM {table} WHERE {url_column} IS NOT NULL")
+        ).all()
+        updates = [
+            {"id": row_id, "public_id": public_id}
+            for row_id, url in rows
+            if (public_id := _public_id_from_url(url))
+        ]
+        if updates:
+            connection.execute(
+                sa.text(f"UPDATE {table} SET {public_id_column} = :public_id WHERE id = :id"),
+                updates,
+            )
+
+
+def downgrade():
+    for table, public_id_column, _ in reversed(IMAGE_COLUMNS):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_column(public_id_column)
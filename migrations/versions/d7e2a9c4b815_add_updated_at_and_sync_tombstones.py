@@ -0,0 +1,66 @@
+"""add updated_at and sync tombstones
+
+Revision ID: d7e2a9c4b815
+Revises: c3d91e5a7f20
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d7e2a9c4b815"
+down_revision = "c3d91e5a7f20"
+branch_labels = None
+depends_on = None
+
+
+# Tables whose rows are served by GET /sync get an index on updated_at.
+SYNCED_TABLES = ("booking", "contacts", "users")
+OTHER_TABLES = (
+    "service",
+    "portfolio_items",
+    "portfolio_images",
+    "hardware_categories",
+    "hardware_items",
+    "site_settings",
+)
+# Tables without a created_at column are backfilled with the migration time.
+TABLES_WITHOUT_CREATED_AT = ("users", "portfolio_images", "site_settings")
+
+
+def upgrade():
+    for table in SYNCED_TABLES + OTHER_TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(sa.Column("updated_at", sa.DateTime(), nullable=True))
+
+        if table in TABLES_WITHOUT_CREATED_AT:
+            op.execute(f"UPDATE {table} SET updated_at = CURRENT_TIMESTAMP")
+        else:
+            op.execute(f"UPDATE {table} SET updated_at = COALESCE(created_at, CURRENT_TIMESTAMP)")
+
+    for table in SYNCED_TABLES:
+        op.create_index(f"ix_{table}_updated_at", table, ["updated_at"])
+
+    op.create_table(
+        "sync_tombstones",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("entity", sa.String(length=30), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_sync_tombstones_entity_id", "sync_tombstones", ["entity", "id"])
+
+
+def downgrade():
+    op.drop_index("ix_sync_tombstones_entity_id", table_name="sync_tombstones")
+    op.drop_table("sync_tombstones")
+
+    for table in SYNCED_TABLES:
+        op.drop_index(f"ix_{table}_updated_at", table_name=table)
+
+    for table in reversed(SYNCED_TABLES + OTHER_TABLES):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_column("updated_at")
@@ -0,0 +1,70 @@
+"""copy rollup fields onto archived records
+
+Revision ID: d8e3f6a2b914
+Revises: c5d2a8e7f149
+Create Date: 2026-10-20 14:00:00.000000
+
+"""
+import json
+from datetime import datetime
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d8e3f6a2b914"
+down_revision = "c5d2a8e7f149"
+branch_labels = None
+depends_on = None
+
+
+def _parse_datetime(value):
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def upgrade():
+    with op.batch_alter_table("archived_records", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("status", sa.String(length=20), nullable=True))
+        batch_op.add_column(sa.Column("is_read", sa.Boolean(), nullable=True))
+        batch_op.add_column(sa.Column("responded_at", sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column("service_id", sa.Integer(), nullable=True))
+
+    archived = sa.table(
+        "archived_records",
+        sa.column("id", sa.Integer),
+        sa.column("data", sa.Text),
+        sa.column("status", sa.String),
+        sa.column("is_read", sa.Boolean),
+        sa.column("responded_at", sa.DateTime),
+        sa.column("service_id", sa.Integer),
+    )
+    connection = op.get_bind()
+    rows = connection.execute(sa.select(archived.c.id, archived.c.data)).fetchall()
+    for record_id, data in rows:
+        try:
+            data = json.loads(data)
+        except (TypeError, ValueError):
+            continue
+        connection.execute(
+            archived.update()
+            .where(archived.c.id == record_id)
+            .values(
+                status=data.get("status"),
+                is_read=bool(data.get("is_read")),
+                responded_at=_parse_datetime(data.get("responded_at")),
+                service_id=data.get("service_id"),
+            )
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("archived_records", schema=None) as batch_op:
+        batch_op.drop_column("service_id")
+        batch_op.drop_column("responded_at")
+        batch_op.drop_column("is_read")
+        batch_op.drop_column("status")
@@ -0,0 +1,48 @@
+"""add responded_at and daily analytics rollups
+
+Revision ID: e4b7c1f93a26
+Revises: d7e2a9c4b815
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e4b7c1f93a26"
+down_revision = "d7e2a9c4b815"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing rows stay NULL: when they were first handled is not recorded.
+    for table in ("booking", "contacts"):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(sa.Column("responded_at", sa.DateTime(), nullable=True))
+
+    op.create_table(
+        "daily_rollups",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(length=20), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("service_id", sa.Integer(), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("total", sa.Integer(), nullable=False),
+        sa.Column("responded", sa.Integer(), nullable=False),
+        sa.Column("response_seconds_total", sa.Float(), nullable=False),
+        sa.Column("response_seconds_max", sa.Float(), nullable=True),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_daily_rollups_kind_day", "daily_rollups", ["kind", "day"])
+
+
+def downgrade():
+    op.drop_index("ix_daily_rollups_kind_day", table_name="daily_rollups")
+    op.drop_table("daily_rollups")
+
+    for table in ("contacts", "booking"):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_column("responded_at")
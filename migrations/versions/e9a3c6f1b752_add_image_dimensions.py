@@ -0,0 +1,57 @@
+"""store width and height next to every image url
+
+Revision ID: e9a3c6f1b752
+Revises: d4f7b2c8e915
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e9a3c6f1b752"
+down_revision = "d4f7b2c8e915"
+branch_labels = None
+depends_on = None
+
+
+# (table, width column, height column)
+IMAGE_COLUMNS = (
+    ("service", "image_width", "image_height"),
+    ("portfolio_items", "image_width", "image_height"),
+    ("portfolio_images", "width", "height"),
+    ("hardware_items", "image_width", "image_height"),
+)
+
+
+def upgrade():
+    for table, width_column, height_column in IMAGE_COLUMNS:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(sa.Column(width_column, sa.Integer(), nullable=True))
+            batch_op.add_column(sa.Column(height_column, sa.Integer(), nullable=True))
+
+    # Images uploaded through the server were recorded in uploaded_assets
+    # with their dimensions; older or seeded rows stay NULL.
+    for table, width_column, height_column in IMAGE_COLUMNS:
+        op.execute(
+            f"""
+            UPDATE {table} SET
+                {width_column} = (
+                    SELECT MAX(uploaded_assets.width) FROM uploaded_assets
+                    WHERE uploaded_assets.secure_url = {table}.image_url
+                ),
+                {height_column} = (
+                    SELECT MAX(uploaded_assets.height) FROM uploaded_assets
+                    WHERE uploaded_assets.secure_url = {table}.image_url
+                )
+            WHERE image_url IS NOT NULL
+            """
+        )
+
+
+def downgrade():
+    for table, width_column, height_column in reversed(IMAGE_COLUMNS):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_column(height_column)
+            batch_op.drop_column(width_column)
@@ -0,0 +1,39 @@
+"""add idempotency records
+
+Revision ID: f1a8d3b6c042
+Revises: e4b7c1f93a26
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "f1a8d3b6c042"
+down_revision = "e4b7c1f93a26"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "idempotency_records",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("scope", sa.String(length=30), nullable=False),
+        sa.Column("key", sa.String(length=255), nullable=False),
+        sa.Column("fingerprint", sa.String(length=64), nullable=False),
+        sa.Column("status_code", sa.Integer(), nullable=False),
+        sa.Column("response_body", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("scope", "key", name="uq_idempotency_records_scope_key"),
+    )
+    op.create_index(
+        "ix_idempotency_records_created_at", "idempotency_records", ["created_at"]
+    )
+
+
+def downgrade():
+    op.drop_index("ix_idempotency_records_created_at", table_name="idempotency_records")
+    op.drop_table("idempotency_records")
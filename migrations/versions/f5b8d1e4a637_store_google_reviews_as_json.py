@@ -0,0 +1,94 @@
+"""store google reviews in a json column
+
+Revision ID: f5b8d1e4a637
+Revises: e9a3c6f1b752
+Create Date: 2026-10-19 22:00:00.000000
+
+"""
+import json
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "f5b8d1e4a637"
+down_revision = "e9a3c6f1b752"
+branch_labels = None
+depends_on = None
+
+
+REVIEWS_TYPE = sa.JSON().with_variant(postgresql.JSONB(), "postgresql")
+REVIEW_FIELDS = (
+    "id", "author_name", "author_url", "profile_photo_url", "rating", "text",
+    "relative_time_description", "time",
+)
+REVIEW_ALIASES = {"name": "author_name", "comment": "text"}
+
+
+def _normalize(raw):
+    # Lenient version of normalize_reviews in server/helpers/reviews.py:
+    # entries it cannot use are dropped instead of failing the upgrade.
+    try:
+        entries = json.loads(raw) if raw else []
+    except ValueError:
+        return None
+    if not isinstance(entries, list):
+        return None
+
+    reviews = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        review = {}
+        for key, value in entry.items():
+            key = REVIEW_ALIASES.get(key, key)
+            if key in REVIEW_FIELDS and value not in (None, "") and key not in review:
+                review[key] = value
+        for key in ("rating", "time"):
+            try:
+                review[key] = int(float(review[key]))
+            except (KeyError, TypeError, ValueError):
+                review.pop(key, None)
+        if "rating" in review and not 1 <= review["rating"] <= 5:
+            del review["rating"]
+        if "text" in review or "rating" in review:
+            reviews.append(review)
+    return reviews or None
+
+
+def upgrade():
+    with op.batch_alter_table("site_settings", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("google_reviews", REVIEWS_TYPE, nullable=True))
+
+    connection = op.get_bind()
+    settings = sa.table("site_settings", sa.column("id"), sa.column("google_reviews", REVIEWS_TYPE))
+    rows = connection.execute(
+        sa.text("SELECT id, google_reviews_json FROM site_settings WHERE google_reviews_json IS NOT NULL")
+    ).all()
+    for row_id, raw in rows:
+        connection.execute(
+            settings.update().where(settings.c.id == row_id).values(google_reviews=_normalize(raw))
+        )
+
+    with op.batch_alter_table("site_settings", schema=None) as batch_op:
+        batch_op.drop_column("google_reviews_json")
+
+
+def downgrade():
+    with op.batch_alter_table("site_settings", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("google_reviews_json", sa.Text(), nullable=True))
+
+    connection = op.get_bind()
+    settings = sa.table("site_settings", sa.column("id"), sa.column("google_reviews", REVIEWS_TYPE))
+    rows = connection.execute(
+        sa.select(settings.c.id, settings.c.google_reviews).where(settings.c.google_reviews.isnot(None))
+    ).all()
+    for row_id, reviews in rows:
+        connection.execute(
+            sa.text("UPDATE site_settings SET google_reviews_json = :raw WHERE id = :id"),
+            {"raw": json.dumps(reviews) if reviews else None, "id": row_id},
+        )
+
+    with op.batch_alter_table("site_settings", schema=None) as batch_op:
+        batch_op.drop_column("google_reviews")
@@ -3,6 +3,10 @@ from  server.extension import db,migrate,jwt
 from dotenv import load_dotenv
 from server.route import register_routes
 from server.seed import run_seeds
+from server.service.analytics_service import refresh_rollups_command
+from server.service.archive_service import archive_records_command
+from server.service.asset_gc_service import gc_assets_command
+from server.service.sync_service import prune_tombstones_command
 from flask_cors import CORS
 import os
 
@@ -23,6 +27,10 @@ def create_app():
         return {"message":"Welcome to Radam construction Api"}
     
     register_routes(app)
+    app.cli.add_command(refresh_rollups_command)
+    app.cli.add_command(archive_records_command)
+    app.cli.add_command(gc_assets_command)
+    app.cli.add_command(prune_tombstones_command)
     # run_seeds(app)
     
     return app
@@ -0,0 +1,112 @@
+"""Compare SerializerMixin.to_dict with the explicit serializers.
+
+Run from the repository root:
+
+    python -m server.benchmarks.serializer_benchmark [rows]
+
+Uses a throwaway in-memory SQLite database, so no configuration is needed.
+"""
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+os.environ["FLASK_SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+
+from sqlalchemy.orm import joinedload, selectinload
+
+from server.app import create_app
+from server.extension import db
+from server.models import Booking, PortfolioImage, PortfolioItem, Service, User
+from server.helpers.serializers import (
+    serialize_booking,
+    serialize_portfolio_item,
+    serialize_service,
+    serialize_user,
+)
+
+
+def _seed(rows):
+    users = [User(username=f"user{i}", email=f"user{i}@example.com", password_hash="x") for i in range(5)]
+    services = [Service(name=f"Service {i}", description="Description", price=1000.0 * i) for i in range(10)]
+    db.session.add_all(users + services)
+    db.session.flush()
+
+    start = datetime(2025, 1, 1)
+    db.session.add_all(
+        Booking(
+            name=f"Customer {i}",
+            phone="0700000000",
+            email=f"customer{i}@example.com",
+            message="Please call me back about a quote.",
+            status="pending",
+            created_at=start + timedelta(minutes=i),
+            service_id=services[i % len(services)].id,
+            assigned_user_id=users[i % len(users)].id if i % 3 else None,
+        )
+        for i in range(rows)
+    )
+
+    for i in range(max(rows // 20, 1)):
+        item = PortfolioItem(tittle=f"Project {i}", description="Description", image_url="cover.jpg")
+        db.session.add(item)
+        db.session.add_all(PortfolioImage(image_url=f"{i}-{n}.jpg", portfolio=item) for n in range(5))
+    db.session.commit()
+
+
+def _time(label, func, objects):
+    started = time.perf_counter()
+    result = [func(obj) for obj in objects]
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<18} {elapsed * 1000:9.1f} ms  ({elapsed / len(objects) * 1e6:6.1f} us/row)")
+    return result, elapsed
+
+
+def _compare(title, objects, mixin, explicit):
+    print(f"{title} ({len(objects)} rows)")
+    expected, mixin_time = _time("SerializerMixin", mixin, objects)
+    actual, explicit_time = _time("explicit", explicit, objects)
+    if expected != actual:
+        sys.exit(f"{title}: explicit serializer output differs from to_dict()")
+    print(f"  speedup            {mixin_time / explicit_time:9.1f}x\n")
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        _seed(rows)
+
+        bookings = Booking.query.options(
+            joinedload(Booking.service), joinedload(Booking.assigned_user)
+        ).all()
+        _compare(
+            "Booking",
+            bookings,
+            lambda b: b.to_dict(rules=("-service.bookings",)),
+            serialize_booking,
+        )
+
+        services = Service.query.options(
+            selectinload(Service.bookings).joinedload(Booking.assigned_user)
+        ).all()
+        _compare("Service", services, lambda s: s.to_dict(), serialize_service)
+
+        users = User.query.options(
+            selectinload(User.assigned_bookings).joinedload(Booking.service)
+        ).all()
+        _compare("User", users, lambda u: u.to_dict(), serialize_user)
+
+        items = PortfolioItem.query.options(selectinload(PortfolioItem.images)).all()
+        _compare(
+            "PortfolioItem",
+            items,
+            lambda i: i.to_dict(rules=("-images.portfolio",)),
+            serialize_portfolio_item,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Check that archiving keeps a day's analytics totals.
+
+Archives part of a day, then writes to a row left on that day, which
+rebuilds the day's rollups. The totals must match what they were before
+the archive ran.
+
+Run from the repository root:
+
+    python -m server.checks.archive_rollups
+
+Uses a throwaway in-memory SQLite database, so no configuration is needed.
+"""
+import os
+import sys
+from datetime import datetime, timedelta
+
+os.environ["FLASK_SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+os.environ.setdefault("JWT_SECRET_KEY", "check")
+
+from server.app import create_app
+from server.extension import db
+from server.models import ArchivedRecord, Booking, Contact, DailyRollup
+from server.service.analytics_service import refresh_rollup_range
+from server.service.archive_service import ARCHIVE_CLOSED_AFTER_DAYS, archive_records
+
+
+def _seed(created_at):
+    responded_at = created_at + timedelta(hours=2)
+    db.session.add_all([
+        Booking(name="Confirmed", phone="0700000001", email="a@example.com", message="Quote",
+                status="confirmed", is_read=True, responded_at=responded_at, created_at=created_at),
+        Booking(name="Confirmed", phone="0700000002", email="b@example.com", message="Quote",
+                status="confirmed", is_read=True, responded_at=responded_at, created_at=created_at),
+        Booking(name="Pending", phone="0700000003", email="c@example.com", message="Quote",
+                status="pending", created_at=created_at),
+        Contact(name="Read", email="d@example.com", subject="Hi", message="Hello",
+                is_read=True, responded_at=responded_at, created_at=created_at),
+        Contact(name="Unread", email="e@example.com", subject="Hi", message="Hello",
+                created_at=created_at),
+    ])
+    db.session.commit()
+
+
+def _totals(day):
+    rows = DailyRollup.query.filter(DailyRollup.day == day).all()
+    return sorted(
+        (row.kind, row.service_id, row.status, row.total, row.responded, row.response_seconds_total)
+        for row in rows
+    )
+
+
+def _expect(label, expected, actual):
+    if expected != actual:
+        sys.exit(f"{label}: rollups changed\n  before: {expected}\n  after:  {actual}")
+    print(f"  {label:<28} ok")
+
+
+def main():
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        now = datetime.utcnow()
+        created_at = now - timedelta(days=ARCHIVE_CLOSED_AFTER_DAYS + 10)
+        day = created_at.date()
+
+        _seed(created_at)
+        refresh_rollup_range(day, day)
+        expected = _totals(day)
+
+        moved = archive_records(now=now)
+        if moved != {"bookings": 2, "contacts": 1} or ArchivedRecord.query.count() != 3:
+            sys.exit(f"Unexpected archive result: {moved}")
+        print(f"Archived {moved}")
+        _expect("after archive", expected, _totals(day))
+
+        # Any ORM write on a remaining row refreshes the whole day.
+        Booking.query.filter_by(status="pending").one().message = "Updated"
+        Contact.query.filter_by(is_read=False).one().message = "Updated"
+        db.session.commit()
+        _expect("after a write on that day", expected, _totals(day))
+
+        refresh_rollup_range(day, day)
+        _expect("after a full rebuild", expected, _totals(day))
+
+
+if __name__ == "__main__":
+    main()
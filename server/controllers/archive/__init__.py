@@ -0,0 +1,5 @@
+from flask import Blueprint
+
+archive_bp = Blueprint("archive_bp", __name__)
+
+from . import archive_controller
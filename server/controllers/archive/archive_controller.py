@@ -0,0 +1,68 @@
+import json
+from flask import request
+from flask_restful import Api, Resource
+from flask_jwt_extended import jwt_required
+from server.models import ArchivedRecord
+from server.helpers.pagination import keyset_page, parse_datetime, parse_limit
+from server.helpers.serializers import DATETIME_FORMAT
+from server.service.archive_service import ARCHIVE_ENTITIES
+from . import archive_bp
+
+api = Api(archive_bp)
+
+
+def _serialize_archived(record):
+    return {
+        "entity": record.entity,
+        "archived_at": record.archived_at.strftime(DATETIME_FORMAT),
+        **json.loads(record.data),
+    }
+
+
+class ArchiveListResource(Resource):
+    @jwt_required()
+    def get(self, entity):
+        if entity not in ARCHIVE_ENTITIES:
+            return {"error": f"Unknown archive {entity}"}, 404
+
+        query = ArchivedRecord.query.filter(ArchivedRecord.entity == entity)
+        email = (request.args.get("email") or "").strip().lower()
+        if email:
+            query = query.filter(ArchivedRecord.email == email)
+
+        try:
+            if request.args.get("created_from"):
+                query = query.filter(
+                    ArchivedRecord.created_at
+                    >= parse_datetime(request.args["created_from"], "created_from")
+                )
+            if request.args.get("created_to"):
+                query = query.filter(
+                    ArchivedRecord.created_at
+                    < parse_datetime(request.args["created_to"], "created_to")
+                )
+            records, next_cursor = keyset_page(
+                query,
+                ArchivedRecord.created_at,
+                ArchivedRecord.id,
+                cursor=request.args.get("cursor"),
+                limit=parse_limit(request.args.get("limit")),
+            )
+        except ValueError as error:
+            return {"error": str(error)}, 400
+
+        return {
+            "items": [_serialize_archived(record) for record in records],
+            "next_cursor": next_cursor,
+        }, 200
+
+
+class ArchivedRecordResource(Resource):
+    @jwt_required()
+    def get(self, entity, entity_id):
+        record = ArchivedRecord.query.filter_by(entity=entity, entity_id=entity_id).first_or_404()
+        return _serialize_archived(record), 200
+
+
+api.add_resource(ArchiveListResource, "/archive/<string:entity>")
+api.add_resource(ArchivedRecordResource, "/archive/<string:entity>/<int:entity_id>")
@@ -1,6 +1,6 @@
 from flask_restful import Resource,Api
 from flask import request
-from server.models.user import User
+from server.models.user import User, normalize_email
 from server.extension import db
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
 from server.service.password_reset_service import (
@@ -15,14 +15,14 @@ api=Api(auth_bp)
 
 class Login(Resource):
     def post(self):
-        data = request.get_json()
-        email = data.get('email')
+        data = request.get_json() or {}
+        email = normalize_email(data.get('email'))
         password = data.get('password')
 
         if not email or not password:
             return {"error": "Email and password are required"}, 400
 
-        user = User.query.filter_by(email=email).first()
+        user = User.find_by_email(email)
         if user and user.check_password(password):
             token = create_access_token(identity=user.id)
             return {
@@ -39,12 +39,12 @@ class Login(Resource):
 class ForgotPassword(Resource):
     def post(self):
         data = request.get_json() or {}
-        email = (data.get("email") or "").strip().lower()
+        email = normalize_email(data.get("email"))
 
         if not email:
             return {"error": "Email is required"}, 400
 
-        user = User.query.filter_by(email=email).first()
+        user = User.find_by_email(email)
         if user:
             # Prefer explicit env var; fall back to request origin so the
             # link works even if FRONTEND_URL is not yet set on Render.
@@ -87,7 +87,7 @@ class ResetPassword(Resource):
         except ValueError as error:
             return {"error": str(error)}, 400
 
-        user = User.query.filter_by(email=email).first()
+        user = User.find_by_email(email)
         if not user:
             return {"error": "No account found for this reset link"}, 404
 
@@ -1,20 +1,110 @@
+from datetime import datetime
 from flask import request
 from flask_restful import Resource,Api
 from flask_jwt_extended import jwt_required
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
 from server.extension import db
 from server.models import Service, Booking, User
+from server.helpers.serializers import serialize_booking
+from server.helpers.bulk import bulk_update, parse_bulk_request
+from server.helpers.csv_export import csv_response
+from server.helpers.pagination import (
+    keyset_page,
+    parse_bool,
+    parse_datetime,
+    parse_limit,
+)
 from server.service.notification_service import send_new_booking_notification, send_booking_acknowledgement
+from server.service.event_service import publish_event
+from server.service.analytics_service import queue_rollup_refresh
+from server.service.idempotency_service import IdempotentRequest
 from . import booking_bp
 
 api = Api(booking_bp)
+
+
+def _optional_id(value, name):
+    try:
+        return int(value)
+    except (TypeError, ValueError) as error:
+        raise ValueError(f"{name} must be a number or 'none'") from error
+
+
+def filter_bookings_query(query, args):
+    status = (args.get("status") or "").strip()
+    if status:
+        statuses = [value.strip() for value in status.split(",") if value.strip()]
+        query = query.filter(Booking.status.in_(statuses))
+
+    if args.get("is_read") not in (None, ""):
+        query = query.filter(Booking.is_read == parse_bool(args["is_read"], "is_read"))
+
+    assigned_user_id = (args.get("assigned_user_id") or "").strip()
+    if assigned_user_id.lower() in ("none", "null", "unassigned"):
+        query = query.filter(Booking.assigned_user_id.is_(None))
+    elif assigned_user_id:
+        query = query.filter(
+            Booking.assigned_user_id == _optional_id(assigned_user_id, "assigned_user_id")
+        )
+
+    service_id = (args.get("service_id") or "").strip()
+    if service_id.lower() in ("none", "null"):
+        query = query.filter(Booking.service_id.is_(None))
+    elif service_id:
+        query = query.filter(Booking.service_id == _optional_id(service_id, "service_id"))
+
+    if args.get("created_from"):
+        query = query.filter(
+            Booking.created_at >= parse_datetime(args["created_from"], "created_from")
+        )
+    if args.get("created_to"):
+        query = query.filter(
+            Booking.created_at < parse_datetime(args["created_to"], "created_to")
+        )
+
+    return query
+
+
 class BookingListResource(Resource):
     @jwt_required()
     def get(self):
-        bookings = Booking.query.all()
-        return [b.to_dict(rules=("-service.bookings",)) for b in bookings], 200
+        try:
+            limit = parse_limit(request.args.get("limit"))
+            query = filter_bookings_query(
+                Booking.query.options(
+                    joinedload(Booking.service), joinedload(Booking.assigned_user)
+                ),
+                request.args,
+            )
+            bookings, next_cursor = keyset_page(
+                query,
+                Booking.created_at,
+                Booking.id,
+                cursor=request.args.get("cursor"),
+                limit=limit,
+            )
+        except ValueError as error:
+            return {"error": str(error)}, 400
+
+        return {
+            "items": [serialize_booking(b) for b in bookings],
+            "next_cursor": next_cursor,
+        }, 200
 
     def post(self):
         data = request.get_json()
+        try:
+            idempotency = IdempotentRequest(
+                "bookings", data, request.headers.get("Idempotency-Key")
+            )
+            replay = idempotency.replay()
+        except ValueError as error:
+            return {"error": str(error)}, 400
+        if replay:
+            return replay
+
         service_id = data.get("service_id")
         service = Service.query.get(service_id) if service_id else None
 
@@ -26,7 +116,30 @@ class BookingListResource(Resource):
             service_id=service.id if service else None
         )
         db.session.add(booking)
-        db.session.commit()
+        db.session.flush()
+        response = serialize_booking(booking)
+        idempotency.remember(response, 201)
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # A concurrent retry with the same key committed first.
+            db.session.rollback()
+            try:
+                replay = idempotency.replay()
+            except ValueError as error:
+                # The winner used the same key for a different body.
+                return {"error": str(error)}, 400
+            if replay:
+                return replay
+            raise
+
+        publish_event("booking.created", {
+            "id": booking.id,
+            "name": booking.name,
+            "email": booking.email,
+            "service": booking.service.name if booking.service else None,
+            "created_at": booking.created_at.isoformat(),
+        })
 
         try:
             send_new_booking_notification(booking)
@@ -42,14 +155,14 @@ class BookingListResource(Resource):
         except Exception as error:
             print(f"Booking acknowledgement failed: {error}")
 
-        return booking.to_dict(rules=("-service.bookings",)), 201
+        return response, 201
 
 
 class BookingResource(Resource):
     @jwt_required()
     def get(self, booking_id):
         booking = Booking.query.get_or_404(booking_id)
-        return booking.to_dict(rules=("-service.bookings",)), 200
+        return serialize_booking(booking), 200
 
     @jwt_required()
     def put(self, booking_id):
@@ -68,8 +181,11 @@ class BookingResource(Resource):
                 else None
             )
 
+        if booking.responded_at is None and (booking.is_read or (booking.status or "pending") != "pending"):
+            booking.responded_at = datetime.utcnow()
+
         db.session.commit()
-        return booking.to_dict(rules=("-service.bookings",)), 200
+        return serialize_booking(booking), 200
 
     @jwt_required()
     def delete(self, booking_id):
@@ -78,5 +194,87 @@ class BookingResource(Resource):
         db.session.commit()
         return {"message": "Booking deleted"}, 200
 
+def _parse_assigned_user_id(value):
+    # An explicit null (or empty string from a form) unassigns.
+    if value is None or value == "":
+        return None
+    if isinstance(value, bool):
+        raise ValueError("assigned_user_id must be a user id or null")
+    try:
+        user_id = int(value)
+    except (TypeError, ValueError) as error:
+        raise ValueError("assigned_user_id must be a user id or null") from error
+    if db.session.get(User, user_id) is None:
+        raise ValueError(f"User {user_id} does not exist")
+    return user_id
+
+
+class BookingBulkResource(Resource):
+    @jwt_required()
+    def post(self):
+        data = request.get_json() or {}
+        try:
+            ids, patch = parse_bulk_request(data, ("status", "is_read", "assigned_user_id"))
+        except ValueError as error:
+            return {"error": str(error)}, 400
+
+        values = {}
+        try:
+            if "status" in patch:
+                status = (patch["status"] or "").strip()
+                if not status:
+                    raise ValueError("status cannot be empty")
+                values[Booking.status] = status
+            if "is_read" in patch:
+                values[Booking.is_read] = parse_bool(patch["is_read"], "is_read")
+            if "assigned_user_id" in patch:
+                values[Booking.assigned_user_id] = _parse_assigned_user_id(patch["assigned_user_id"])
+        except ValueError as error:
+            return {"error": str(error)}, 400
+        if values.get(Booking.is_read) or values.get(Booking.status, "pending") != "pending":
+            values[Booking.responded_at] = func.coalesce(Booking.responded_at, datetime.utcnow())
+
+        queue_rollup_refresh(Booking, ids)
+        return bulk_update(Booking, ids, values, db.session), 200
+
+
+BOOKING_EXPORT_COLUMNS = (
+    ("id", Booking.id),
+    ("created_at", Booking.created_at),
+    ("name", Booking.name),
+    ("phone", Booking.phone),
+    ("email", Booking.email),
+    ("service", Service.name),
+    ("status", Booking.status),
+    ("is_read", Booking.is_read),
+    ("assigned_to", User.username),
+    ("responded_at", Booking.responded_at),
+    ("message", Booking.message),
+)
+
+
+class BookingExportResource(Resource):
+    @jwt_required()
+    def get(self):
+        # Plain columns instead of ORM objects, so streamed rows never pile up
+        # in the session's identity map.
+        statement = (
+            select(*(column for _, column in BOOKING_EXPORT_COLUMNS))
+            .outerjoin(Service, Booking.service_id == Service.id)
+            .outerjoin(User, Booking.assigned_user_id == User.id)
+            .order_by(Booking.created_at.desc(), Booking.id.desc())
+        )
+        try:
+            statement = filter_bookings_query(statement, request.args)
+        except ValueError as error:
+            return {"error": str(error)}, 400
+
+        return csv_response(
+            statement, [name for name, _ in BOOKING_EXPORT_COLUMNS], "bookings"
+        )
+
+
 api.add_resource(BookingListResource,'/bookings')
+api.add_resource(BookingExportResource, '/bookings/export')
+api.add_resource(BookingBulkResource, '/bookings/bulk')
 api.add_resource(BookingResource,'/bookings/<int:booking_id>')
@@ -1,24 +1,76 @@
+from datetime import datetime
 from flask import request
 from flask_restful import Resource, Api
 from flask_jwt_extended import jwt_required
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
 from server.extension import db
 from server.models import Contact
+from server.helpers.bulk import bulk_update, parse_bulk_request
+from server.helpers.csv_export import csv_response
+from server.helpers.pagination import keyset_page, parse_bool, parse_datetime, parse_limit
+from server.helpers.search import filter_contacts_search
 from server.service.notification_service import send_new_contact_notification, send_contact_acknowledgement
+from server.service.event_service import publish_event
+from server.service.analytics_service import queue_rollup_refresh
+from server.service.idempotency_service import IdempotentRequest
 from . import contact_bp
 
 api = Api(contact_bp)
 
+
+def filter_contacts_query(query, args):
+    if args.get("is_read") not in (None, ""):
+        query = query.filter(Contact.is_read == parse_bool(args["is_read"], "is_read"))
+    if args.get("created_from"):
+        query = query.filter(
+            Contact.created_at >= parse_datetime(args["created_from"], "created_from")
+        )
+    if args.get("created_to"):
+        query = query.filter(
+            Contact.created_at < parse_datetime(args["created_to"], "created_to")
+        )
+    if args.get("q"):
+        query = filter_contacts_search(query, args["q"])
+    return query
+
+
 class ContactListResource(Resource):
     @jwt_required()
     def get(self):
-        contacts = Contact.query.order_by(Contact.created_at.desc()).all()
-        return [c.to_dict() for c in contacts], 200
+        try:
+            limit = parse_limit(request.args.get("limit"))
+            query = filter_contacts_query(Contact.query, request.args)
+            contacts, next_cursor = keyset_page(
+                query,
+                Contact.created_at,
+                Contact.id,
+                cursor=request.args.get("cursor"),
+                limit=limit,
+            )
+        except ValueError as error:
+            return {"error": str(error)}, 400
+
+        return {
+            "items": [c.to_dict() for c in contacts],
+            "next_cursor": next_cursor,
+        }, 200
 
     def post(self):
         data = request.get_json()
         if not data.get("name") or not data.get("email") or not data.get("subject") or not data.get("message"):
             return {"error": "Missing required fields"}, 400
 
+        try:
+            idempotency = IdempotentRequest(
+                "contacts", data, request.headers.get("Idempotency-Key")
+            )
+            replay = idempotency.replay()
+        except ValueError as error:
+            return {"error": str(error)}, 400
+        if replay:
+            return replay
+
         contact = Contact(
             name=data.get("name"),
             email=data.get("email"),
@@ -27,7 +79,30 @@ class ContactListResource(Resource):
             message=data.get("message")
         )
         db.session.add(contact)
-        db.session.commit()
+        db.session.flush()
+        response = contact.to_dict()
+        idempotency.remember(response, 201)
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # A concurrent retry with the same key committed first.
+            db.session.rollback()
+            try:
+                replay = idempotency.replay()
+            except ValueError as error:
+                # The winner used the same key for a different body.
+                return {"error": str(error)}, 400
+            if replay:
+                return replay
+            raise
+
+        publish_event("contact.created", {
+            "id": contact.id,
+            "name": contact.name,
+            "email": contact.email,
+            "subject": contact.subject,
+            "created_at": contact.created_at.isoformat(),
+        })
 
         try:
             send_new_contact_notification(contact)
@@ -43,7 +118,7 @@ class ContactListResource(Resource):
         except Exception as error:
             print(f"Contact acknowledgement failed: {error}")
 
-        return contact.to_dict(), 201
+        return response, 201
 
 
 class ContactResource(Resource):
@@ -59,6 +134,8 @@ class ContactResource(Resource):
 
         if "is_read" in data:
             contact.is_read = bool(data["is_read"])
+        if contact.is_read and contact.responded_at is None:
+            contact.responded_at = datetime.utcnow()
 
         db.session.commit()
         return contact.to_dict(), 200
@@ -71,6 +148,55 @@ class ContactResource(Resource):
         return {"message": "Contact deleted"}, 200
 
 
+class ContactBulkResource(Resource):
+    @jwt_required()
+    def post(self):
+        data = request.get_json() or {}
+        try:
+            ids, patch = parse_bulk_request(data, ("is_read",))
+            is_read = parse_bool(patch["is_read"], "is_read")
+        except ValueError as error:
+            return {"error": str(error)}, 400
+
+        values = {Contact.is_read: is_read}
+        if values[Contact.is_read]:
+            values[Contact.responded_at] = func.coalesce(Contact.responded_at, datetime.utcnow())
+
+        queue_rollup_refresh(Contact, ids)
+        return bulk_update(Contact, ids, values, db.session), 200
+
+
+CONTACT_EXPORT_COLUMNS = (
+    ("id", Contact.id),
+    ("created_at", Contact.created_at),
+    ("name", Contact.name),
+    ("email", Contact.email),
+    ("phone", Contact.phone),
+    ("subject", Contact.subject),
+    ("is_read", Contact.is_read),
+    ("responded_at", Contact.responded_at),
+    ("message", Contact.message),
+)
+
+
+class ContactExportResource(Resource):
+    @jwt_required()
+    def get(self):
+        statement = select(*(column for _, column in CONTACT_EXPORT_COLUMNS)).order_by(
+            Contact.created_at.desc(), Contact.id.desc()
+        )
+        try:
+            statement = filter_contacts_query(statement, request.args)
+        except ValueError as error:
+            return {"error": str(error)}, 400
+
+        return csv_response(
+            statement, [name for name, _ in CONTACT_EXPORT_COLUMNS], "contacts"
+        )
+
+
 # Register routes
 api.add_resource(ContactListResource, "/contacts")
 api.add_resource(ContactResource, "/contacts/<int:contact_id>")
+api.add_resource(ContactBulkResource, "/contacts/bulk")
+api.add_resource(ContactExportResource, "/contacts/export")
@@ -0,0 +1,187 @@
+from datetime import date, datetime, timedelta
+from flask import request
+from flask_restful import Api, Resource
+from flask_jwt_extended import jwt_required
+from sqlalchemy import func
+from server.extension import db
+from server.models import Booking, Contact, DailyRollup, Service
+from . import dashboard_bp
+
+api = Api(dashboard_bp)
+
+DEFAULT_ANALYTICS_DAYS = 30
+MAX_ANALYTICS_DAYS = 366
+
+
+def _booking_counts():
+    # One GROUP BY over the distinct (status, is_read, assignee) combinations;
+    # the breakdowns are folded from that handful of rows.
+    rows = (
+        db.session.query(
+            Booking.status,
+            Booking.is_read,
+            Booking.assigned_user_id,
+            func.count(Booking.id),
+        )
+        .group_by(Booking.status, Booking.is_read, Booking.assigned_user_id)
+        .all()
+    )
+
+    counts = {
+        "total": 0,
+        "unread": 0,
+        "by_status": {},
+        "by_assignee": {},
+        "unread_by_status": {},
+    }
+    for status, is_read, assigned_user_id, count in rows:
+        status = status or "pending"
+        assignee = str(assigned_user_id) if assigned_user_id else "unassigned"
+
+        counts["total"] += count
+        counts["by_status"][status] = counts["by_status"].get(status, 0) + count
+        counts["by_assignee"][assignee] = counts["by_assignee"].get(assignee, 0) + count
+        if not is_read:
+            counts["unread"] += count
+            counts["unread_by_status"][status] = (
+                counts["unread_by_status"].get(status, 0) + count
+            )
+
+    counts["pending"] = counts["by_status"].get("pending", 0)
+    return counts
+
+
+def _contact_counts():
+    rows = (
+        db.session.query(Contact.is_read, func.count(Contact.id))
+        .group_by(Contact.is_read)
+        .all()
+    )
+
+    counts = {"total": 0, "unread": 0}
+    for is_read, count in rows:
+        counts["total"] += count
+        if not is_read:
+            counts["unread"] += count
+    return counts
+
+
+class DashboardCountsResource(Resource):
+    @jwt_required()
+    def get(self):
+        return {
+            "bookings": _booking_counts(),
+            "contacts": _contact_counts(),
+        }, 200
+
+
+def _parse_day(value, name):
+    try:
+        return date.fromisoformat(value)
+    except ValueError as error:
+        raise ValueError(f"{name} must be a date (YYYY-MM-DD)") from error
+
+
+def _analytics_range(args):
+    today = datetime.utcnow().date()
+    end = _parse_day(args["to"], "to") if args.get("to") else today
+    start = (
+        _parse_day(args["from"], "from")
+        if args.get("from")
+        else end - timedelta(days=DEFAULT_ANALYTICS_DAYS - 1)
+    )
+    if start > end:
+        raise ValueError("from must not be after to")
+    if (end - start).days >= MAX_ANALYTICS_DAYS:
+        raise ValueError(f"The range can span at most {MAX_ANALYTICS_DAYS} days")
+    return start, end
+
+
+def _response_time(responded, seconds_total, seconds_max):
+    return {
+        "responded": responded,
+        "average_seconds": round(seconds_total / responded, 1) if responded else None,
+        "max_seconds": round(seconds_max, 1) if seconds_max is not None else None,
+    }
+
+
+def _fold_rollups(rows, service_names=None):
+    # Rollup rows are already one per (day, service, status); folding a
+    # range of them in Python is cheap next to re-scanning the raw tables.
+    days = {}
+    by_status = {}
+    by_service = {}
+    total = responded = 0
+    seconds_total = 0.0
+    seconds_max = None
+
+    for row in rows:
+        day = days.setdefault(row.day.isoformat(), {"total": 0, "by_status": {}})
+        day["total"] += row.total
+        day["by_status"][row.status] = day["by_status"].get(row.status, 0) + row.total
+        by_status[row.status] = by_status.get(row.status, 0) + row.total
+
+        if service_names is not None:
+            service = by_service.setdefault(row.service_id, {"total": 0, "by_status": {}})
+            service["total"] += row.total
+            service["by_status"][row.status] = service["by_status"].get(row.status, 0) + row.total
+
+        total += row.total
+        responded += row.responded
+        seconds_total += row.response_seconds_total
+        if row.response_seconds_max is not None and (
+            seconds_max is None or row.response_seconds_max > seconds_max
+        ):
+            seconds_max = row.response_seconds_max
+
+    result = {
+        "total": total,
+        "by_status": by_status,
+        "by_day": [{"day": day, **values} for day, values in sorted(days.items())],
+        "response_time": _response_time(responded, seconds_total, seconds_max),
+    }
+    if service_names is not None:
+        result["by_service"] = [
+            {
+                "service_id": service_id,
+                "service": service_names.get(service_id) if service_id else None,
+                **values,
+            }
+            for service_id, values in sorted(
+                by_service.items(), key=lambda item: item[1]["total"], reverse=True
+            )
+        ]
+    return result
+
+
+def _rollups(kind, start, end):
+    return (
+        DailyRollup.query.filter(
+            DailyRollup.kind == kind,
+            DailyRollup.day >= start,
+            DailyRollup.day <= end,
+        )
+        .order_by(DailyRollup.day)
+        .all()
+    )
+
+
+class DashboardAnalyticsResource(Resource):
+    @jwt_required()
+    def get(self):
+        try:
+            start, end = _analytics_range(request.args)
+        except ValueError as error:
+            return {"error": str(error)}, 400
+
+        service_names = dict(db.session.query(Service.id, Service.name).all())
+        return {
+            "from": start.isoformat(),
+            "to": end.isoformat(),
+            "bookings": _fold_rollups(_rollups("booking", start, end), service_names),
+            "contacts": _fold_rollups(_rollups("contact", start, end)),
+        }, 200
+
+
+api.add_resource(DashboardCountsResource, "/dashboard/counts")
+api.add_resource(DashboardAnalyticsResource, "/dashboard/analytics")
@@ -0,0 +1,5 @@
+from flask import Blueprint
+
+events_bp = Blueprint("events_bp", __name__)
+
+from . import events_controller
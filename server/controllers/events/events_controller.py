@@ -0,0 +1,62 @@
+import json
+import queue
+import time
+from flask import Response, request
+from flask_jwt_extended import decode_token, verify_jwt_in_request
+from flask_jwt_extended.exceptions import JWTExtendedException
+from jwt.exceptions import PyJWTError
+from server.service.event_service import get_broker
+from . import events_bp
+
+HEARTBEAT_SECONDS = 15
+# Streams close after this long; EventSource reconnects on its own, which keeps
+# a worker from being held forever by a forgotten tab.
+STREAM_MAX_SECONDS = 300
+
+
+def _authorized():
+    # EventSource cannot send an Authorization header, so the token may also
+    # come in the query string.
+    token = request.args.get("token")
+    try:
+        if token:
+            # verify_jwt_in_request only accepts access tokens; hold the
+            # query-string path to the same rule.
+            return decode_token(token).get("type") == "access"
+        verify_jwt_in_request()
+        return True
+    except (JWTExtendedException, PyJWTError):
+        return False
+
+
+def _format_event(event):
+    return f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+
+@events_bp.route("/events/stream")
+def event_stream():
+    if not _authorized():
+        return {"error": "Missing or invalid token"}, 401
+
+    broker = get_broker()
+    subscriber = broker.subscribe()
+
+    def generate():
+        deadline = time.monotonic() + STREAM_MAX_SECONDS
+        try:
+            yield "retry: 3000\n\n"
+            while time.monotonic() < deadline:
+                try:
+                    event = subscriber.get(timeout=HEARTBEAT_SECONDS)
+                except queue.Empty:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield _format_event(event)
+        finally:
+            broker.unsubscribe(subscriber)
+
+    return Response(
+        generate(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
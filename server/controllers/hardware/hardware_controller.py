@@ -3,7 +3,7 @@ from flask_restful import Api, Resource
 from flask_jwt_extended import jwt_required
 from server.extension import db
 from server.models import HardwareCategory, HardwareItem
-from server.service.cloudinary_service import upload_files_to_cloudinary
+from server.helpers.uploads import collect_uploaded_images, get_request_data
 from . import hardware_bp
 
 api = Api(hardware_bp)
@@ -145,12 +145,7 @@ class HardwareCategoryResource(Resource):
 class HardwareItemListResource(Resource):
     @jwt_required()
     def post(self):
-        if request.content_type and "multipart/form-data" in request.content_type:
-            data = request.form
-            image = request.files.get("image")
-        else:
-            data = request.get_json() or {}
-            image = None
+        data = get_request_data()
 
         name = (data.get("name") or "").strip()
         description = (data.get("description") or "").strip()
@@ -164,13 +159,18 @@ class HardwareItemListResource(Resource):
             return {"error": "Category is required"}, 400
 
         category = HardwareCategory.query.get_or_404(category_id)
-        image_url = None
+        image_url = image_public_id = image_width = image_height = None
 
-        if image:
-            uploaded = upload_files_to_cloudinary(
-                image, folder="radam-construction/hardware"
-            )
+        try:
+            uploaded = collect_uploaded_images("image", folder="radam-construction/hardware")
+        except ValueError as error:
+            return {"error": str(error)}, 400
+
+        if uploaded:
             image_url = uploaded[0]["secure_url"]
+            image_public_id = uploaded[0]["public_id"]
+            image_width = uploaded[0]["width"]
+            image_height = uploaded[0]["height"]
 
         item = HardwareItem(
             name=name,
@@ -178,6 +178,9 @@ class HardwareItemListResource(Resource):
             unit=unit or None,
             price=float(price) if price not in (None, "") else None,
             image_url=image_url,
+            image_public_id=image_public_id,
+            image_width=image_width,
+            image_height=image_height,
             category=category,
         )
         db.session.add(item)
@@ -190,12 +193,7 @@ class HardwareItemResource(Resource):
     @jwt_required()
     def put(self, item_id):
         item = HardwareItem.query.get_or_404(item_id)
-        if request.content_type and "multipart/form-data" in request.content_type:
-            data = request.form
-            image = request.files.get("image")
-        else:
-            data = request.get_json() or {}
-            image = None
+        data = get_request_data()
 
         name = (data.get("name") or "").strip()
         description = (data.get("description") or "").strip()
@@ -203,6 +201,11 @@ class HardwareItemResource(Resource):
         category_id = data.get("category_id")
         price = data.get("price")
 
+        try:
+            uploaded = collect_uploaded_images("image", folder="radam-construction/hardware")
+        except ValueError as error:
+            return {"error": str(error)}, 400
+
         if name:
             item.name = name
         item.description = description or None
@@ -211,11 +214,11 @@ class HardwareItemResource(Resource):
 
         if category_id:
             item.category = HardwareCategory.query.get_or_404(category_id)
-        if image:
-            uploaded = upload_files_to_cloudinary(
-                image, folder="radam-construction/hardware"
-            )
+        if uploaded:
             item.image_url = uploaded[0]["secure_url"]
+            item.image_public_id = uploaded[0]["public_id"]
+            item.image_width = uploaded[0]["width"]
+            item.image_height = uploaded[0]["height"]
 
         db.session.commit()
         return item.to_dict(), 200
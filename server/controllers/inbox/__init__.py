@@ -0,0 +1,5 @@
+from flask import Blueprint
+
+inbox_bp = Blueprint("inbox_bp", __name__)
+
+from . import inbox_controller
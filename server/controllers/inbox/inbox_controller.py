@@ -0,0 +1,175 @@
+import base64
+import json
+from datetime import datetime
+from flask import request
+from flask_restful import Api, Resource
+from flask_jwt_extended import jwt_required
+from sqlalchemy import and_, func, literal, null, or_, select, union_all
+from server.extension import db
+from server.models import Booking, Contact, Service
+from server.helpers.pagination import parse_bool, parse_limit
+from server.helpers.serializers import DATETIME_FORMAT
+from . import inbox_bp
+
+api = Api(inbox_bp)
+
+INBOX_PAGE_SIZE = 25
+PREVIEW_LENGTH = 200
+INBOX_KINDS = ("booking", "contact")
+
+
+def _encode_cursor(created_at, kind, row_id):
+    payload = json.dumps([created_at.isoformat(), kind, row_id]).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def _decode_cursor(cursor):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, kind, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if kind not in INBOX_KINDS:
+            raise ValueError(kind)
+        return datetime.fromisoformat(created_at), kind, int(row_id)
+    except (TypeError, ValueError) as error:
+        raise ValueError("Invalid cursor") from error
+
+
+def _after_cursor(kind, created_column, id_column, cursor):
+    # The merged order is (created_at, kind, id) descending. Inside one
+    # branch kind is constant, so the tuple comparison reduces to this.
+    created_at, cursor_kind, row_id = cursor
+    if kind < cursor_kind:
+        return created_column <= created_at
+    if kind > cursor_kind:
+        return created_column < created_at
+    return or_(
+        created_column < created_at,
+        and_(created_column == created_at, id_column < row_id),
+    )
+
+
+def _booking_branch():
+    return (
+        select(
+            literal("booking").label("kind"),
+            Booking.id.label("id"),
+            Booking.created_at.label("created_at"),
+            Booking.name.label("name"),
+            Booking.email.label("email"),
+            Booking.phone.label("phone"),
+            Service.name.label("title"),
+            func.substr(Booking.message, 1, PREVIEW_LENGTH).label("preview"),
+            Booking.status.label("status"),
+            Booking.is_read.label("is_read"),
+        )
+        .outerjoin(Service, Booking.service_id == Service.id),
+        Booking,
+    )
+
+
+def _contact_branch():
+    return (
+        select(
+            literal("contact").label("kind"),
+            Contact.id.label("id"),
+            Contact.created_at.label("created_at"),
+            Contact.name.label("name"),
+            Contact.email.label("email"),
+            Contact.phone.label("phone"),
+            Contact.subject.label("title"),
+            func.substr(Contact.message, 1, PREVIEW_LENGTH).label("preview"),
+            null().label("status"),
+            Contact.is_read.label("is_read"),
+        ),
+        Contact,
+    )
+
+
+INBOX_BRANCHES = {
+    "booking": _booking_branch,
+    "contact": _contact_branch,
+}
+
+
+def _parse_kinds(value):
+    if not value:
+        return INBOX_KINDS
+    kinds = tuple(kind for kind in INBOX_KINDS if kind in {v.strip() for v in value.split(",")})
+    if not kinds:
+        raise ValueError(f"kind must be one of: {', '.join(INBOX_KINDS)}")
+    return kinds
+
+
+def _inbox_page(kinds, is_read, cursor, limit):
+    branches = []
+    for kind in kinds:
+        statement, model = INBOX_BRANCHES[kind]()
+        if is_read is not None:
+            statement = statement.where(model.is_read == is_read)
+        if cursor:
+            statement = statement.where(_after_cursor(kind, model.created_at, model.id, cursor))
+        # Each branch is cut to one page on its own (created_at, id) index
+        # before the merge, so the UNION never sees more than 2 * limit rows.
+        branch = (
+            statement.order_by(model.created_at.desc(), model.id.desc())
+            .limit(limit + 1)
+            .subquery()
+        )
+        branches.append(select(branch))
+
+    merged = (union_all(*branches) if len(branches) > 1 else branches[0]).subquery()
+    rows = db.session.execute(
+        select(merged)
+        .order_by(merged.c.created_at.desc(), merged.c.kind.desc(), merged.c.id.desc())
+        .limit(limit + 1)
+    ).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = _encode_cursor(last.created_at, last.kind, last.id)
+    return rows, next_cursor
+
+
+def _serialize_row(row):
+    created_at = row.created_at
+    if isinstance(created_at, str):
+        created_at = datetime.fromisoformat(created_at)
+    return {
+        "kind": row.kind,
+        "id": row.id,
+        "created_at": created_at.strftime(DATETIME_FORMAT) if created_at else None,
+        "name": row.name,
+        "email": row.email,
+        "phone": row.phone,
+        "title": row.title,
+        "preview": row.preview,
+        "status": row.status,
+        "is_read": bool(row.is_read),
+    }
+
+
+class InboxResource(Resource):
+    @jwt_required()
+    def get(self):
+        try:
+            limit = parse_limit(request.args.get("limit"), default=INBOX_PAGE_SIZE)
+            kinds = _parse_kinds(request.args.get("kind"))
+            is_read = (
+                parse_bool(request.args["is_read"], "is_read")
+                if request.args.get("is_read") not in (None, "")
+                else None
+            )
+            cursor = _decode_cursor(request.args["cursor"]) if request.args.get("cursor") else None
+            rows, next_cursor = _inbox_page(kinds, is_read, cursor, limit)
+        except ValueError as error:
+            return {"error": str(error)}, 400
+
+        return {
+            "items": [_serialize_row(row) for row in rows],
+            "next_cursor": next_cursor,
+        }, 200
+
+
+api.add_resource(InboxResource, "/inbox")
@@ -1,62 +1,160 @@
 from flask import request
 from flask_restful import Resource, Api
 from flask_jwt_extended import jwt_required
+from sqlalchemy import func
+from sqlalchemy.orm import selectinload
 from server.extension import db
 from server.models import PortfolioItem, PortfolioImage
-from server.service.cloudinary_service import upload_files_to_cloudinary
+from server.helpers.pagination import keyset_page, parse_bool, parse_limit
+from server.helpers.serializers import serialize_portfolio_item, serialize_portfolio_summary
+from server.helpers.uploads import collect_uploaded_images, count_uploaded_images, get_request_data
 from . import portfolio_bp
 
 api = Api(portfolio_bp)
 
 
+NEW_IMAGE_PREFIX = "new:"
+
+
+def _list_field(data, name):
+    """Read a list from a JSON body, or from repeated / comma-separated form fields."""
+    if hasattr(data, "getlist"):
+        values = []
+        for value in data.getlist(name):
+            values.extend(part.strip() for part in value.split(",") if part.strip())
+        return values
+    value = data.get(name)
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        raise ValueError(f"{name} must be a list")
+    return value
+
+
+def _image_ids(data, name):
+    try:
+        return [int(value) for value in _list_field(data, name)]
+    except (TypeError, ValueError) as error:
+        raise ValueError(f"{name} must be a list of image ids") from error
+
+
+def _image_order(data):
+    # Existing images are referenced by id, new uploads as "new:<index>".
+    order = []
+    for value in _list_field(data, "image_order"):
+        if isinstance(value, str) and value.startswith(NEW_IMAGE_PREFIX):
+            try:
+                order.append(("new", int(value[len(NEW_IMAGE_PREFIX):])))
+            except ValueError as error:
+                raise ValueError(f"Invalid image_order entry {value}") from error
+        else:
+            try:
+                order.append(("existing", int(value)))
+            except (TypeError, ValueError) as error:
+                raise ValueError(f"Invalid image_order entry {value}") from error
+    return order
+
+
+def _image_counts(item_ids):
+    if not item_ids:
+        return {}
+    return dict(
+        db.session.query(PortfolioImage.portfolio_id, func.count(PortfolioImage.id))
+        .filter(PortfolioImage.portfolio_id.in_(item_ids))
+        .group_by(PortfolioImage.portfolio_id)
+        .all()
+    )
+
+
 class PortfolioListResource(Resource):
     def get(self):
-        items = PortfolioItem.query.all()
-        return [i.to_dict(rules=("-images.portfolio",)) for i in items], 200
+        try:
+            limit = parse_limit(request.args.get("limit"))
+            summary = parse_bool(request.args.get("summary") or "false", "summary")
+            query = PortfolioItem.query
+            if not summary:
+                # One extra SELECT ... IN for the whole page instead of one per item.
+                query = query.options(selectinload(PortfolioItem.images))
+            items, next_cursor = keyset_page(
+                query,
+                PortfolioItem.created_at,
+                PortfolioItem.id,
+                cursor=request.args.get("cursor"),
+                limit=limit,
+            )
+        except ValueError as error:
+            return {"error": str(error)}, 400
+
+        if summary:
+            counts = _image_counts([item.id for item in items])
+            serialized = [serialize_portfolio_summary(i, counts.get(i.id, 0)) for i in items]
+        else:
+            serialized = [serialize_portfolio_item(i) for i in items]
+        return {"items": serialized, "next_cursor": next_cursor}, 200
 
     @jwt_required()
     def post(self):
-        tittle = request.form.get("title")
-        description = request.form.get("description")
-        alt_text = request.form.get("alt_text", "").strip() or None
-        files = request.files.getlist("images")
+        data = get_request_data()
+        tittle = data.get("title")
+        description = data.get("description")
+        alt_text = (data.get("alt_text") or "").strip() or None
 
-        if not files:
-            return {"error": "At least one image is required"}, 400
+        # Upload all images, or accept ones the client uploaded directly
+        try:
+            uploaded = collect_uploaded_images("images", folder="radam-construction/portfolio")
+        except ValueError as error:
+            return {"error": str(error)}, 400
 
-        # Upload all images
-        uploaded = upload_files_to_cloudinary(files, folder="radam-construction/portfolio")
+        if not uploaded:
+            return {"error": "At least one image is required"}, 400
 
         # First image becomes the cover
         portfolio = PortfolioItem(
             tittle=tittle,
             description=description,
             image_url=uploaded[0]["secure_url"],
+            image_public_id=uploaded[0]["public_id"],
+            image_width=uploaded[0]["width"],
+            image_height=uploaded[0]["height"],
             alt_text=alt_text,
         )
         db.session.add(portfolio)
         db.session.flush()
 
         # Add all images to PortfolioImage
-        for img in uploaded:
-            db.session.add(PortfolioImage(image_url=img["secure_url"], portfolio=portfolio))
+        for position, img in enumerate(uploaded):
+            db.session.add(
+                PortfolioImage(
+                    image_url=img["secure_url"],
+                    public_id=img["public_id"],
+                    width=img["width"],
+                    height=img["height"],
+                    position=position,
+                    portfolio=portfolio,
+                )
+            )
 
         db.session.commit()
-        return portfolio.to_dict(rules=("-images.portfolio",)), 201
+        return serialize_portfolio_item(portfolio), 201
 
 
 class PortfolioResource(Resource):
     def get(self, portfolio_id):
         item = PortfolioItem.query.get_or_404(portfolio_id)
-        return item.to_dict(rules=("-images.portfolio",)), 200
+        return serialize_portfolio_item(item), 200
 
     @jwt_required()
     def put(self, portfolio_id):
         item = PortfolioItem.query.get_or_404(portfolio_id)
-        tittle = request.form.get("title")
-        description = request.form.get("description")
-        alt_text = request.form.get("alt_text", "").strip() or None
-        files = request.files.getlist("images")
+        data = get_request_data()
+        tittle = data.get("title")
+        description = data.get("description")
+        alt_text = (data.get("alt_text") or "").strip() or None
+
+        try:
+            uploaded = collect_uploaded_images("images", folder="radam-construction/portfolio")
+        except ValueError as error:
+            return {"error": str(error)}, 400
 
         if tittle:
             item.tittle = tittle
@@ -64,21 +162,113 @@ class PortfolioResource(Resource):
             item.description = description
         item.alt_text = alt_text
 
-        if files:
+        if uploaded:
             
             PortfolioImage.query.filter_by(portfolio_id=item.id).delete()
 
-            
-            uploaded = upload_files_to_cloudinary(files, folder="radam-construction/portfolio")
-
             # Update cover image
             item.image_url = uploaded[0]["secure_url"]
+            item.image_public_id = uploaded[0]["public_id"]
+            item.image_width = uploaded[0]["width"]
+            item.image_height = uploaded[0]["height"]
+
+            for position, img in enumerate(uploaded):
+                db.session.add(
+                    PortfolioImage(
+                        image_url=img["secure_url"],
+                        public_id=img["public_id"],
+                        width=img["width"],
+                        height=img["height"],
+                        position=position,
+                        portfolio=item,
+                    )
+                )
+
+        db.session.commit()
+        return serialize_portfolio_item(item), 200
+
+    @jwt_required()
+    def patch(self, portfolio_id):
+        """Change only what is sent: fields, plus keep/remove/add/reorder of images.
+
+        Only files in ``images`` are uploaded. Existing images are kept unless
+        listed in ``remove_image_ids`` or left out of ``keep_image_ids``.
+        ``image_order`` lists image ids and "new:<index>" for uploads; anything
+        it leaves out follows in its current order, then new uploads.
+        """
+        item = PortfolioItem.query.options(selectinload(PortfolioItem.images)).get_or_404(
+            portfolio_id
+        )
+        data = get_request_data()
+        existing = {image.id: image for image in item.images}
+
+        try:
+            removed = set(_image_ids(data, "remove_image_ids"))
+            if "keep_image_ids" in data:
+                removed |= set(existing) - set(_image_ids(data, "keep_image_ids"))
+            order = _image_order(data)
+
+            referenced = removed | {ref for kind, ref in order if kind == "existing"}
+            unknown = referenced - set(existing)
+            if unknown:
+                raise ValueError(
+                    f"Images {sorted(unknown)} do not belong to this portfolio item"
+                )
+            if any(kind == "existing" and ref in removed for kind, ref in order):
+                raise ValueError("image_order cannot include removed images")
+
+            # Everything about the request shape is checked before uploading,
+            # so a 400 never leaves unreferenced images in storage.
+            new_count = count_uploaded_images("images")
+            if any(kind == "new" and not 0 <= ref < new_count for kind, ref in order):
+                raise ValueError("image_order refers to a new image that was not uploaded")
+            kept = [image for image in item.images if image.id not in removed]
+            if not kept and not new_count:
+                raise ValueError("At least one image is required")
+
+            uploaded = collect_uploaded_images("images", folder="radam-construction/portfolio")
+        except ValueError as error:
+            return {"error": str(error)}, 400
+
+        added = [
+            PortfolioImage(
+                image_url=img["secure_url"],
+                public_id=img["public_id"],
+                width=img["width"],
+                height=img["height"],
+            )
+            for img in uploaded
+        ]
+
+        final = []
+        for kind, ref in order:
+            image = existing[ref] if kind == "existing" else added[ref]
+            if image not in final:
+                final.append(image)
+        final += [image for image in kept + added if image not in final]
+
+        for image_id in removed:
+            item.images.remove(existing[image_id])
+        for image in added:
+            item.images.append(image)
+        for position, image in enumerate(final):
+            if image.position != position:
+                image.position = position
+        item.images.sort(key=lambda image: image.position)
+        item.image_url = final[0].image_url
+        item.image_public_id = final[0].public_id
+        item.image_width = final[0].width
+        item.image_height = final[0].height
 
-            for img in uploaded:
-                db.session.add(PortfolioImage(image_url=img["secure_url"], portfolio=item))
+        if data.get("title"):
+            item.tittle = data["title"]
+        if data.get("description"):
+            item.description = data["description"]
+        if "alt_text" in data:
+            item.alt_text = (data.get("alt_text") or "").strip() or None
 
         db.session.commit()
-        return item.to_dict(rules=("-images.portfolio",)), 200
+        return serialize_portfolio_item(item), 200
 
     @jwt_required()
     def delete(self, portfolio_id):
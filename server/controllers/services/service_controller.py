@@ -1,10 +1,10 @@
-from flask import request
 from flask_restful import Resource, Api
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from server.extension import db
 from server.models import Service
-from server.service.cloudinary_service import upload_files_to_cloudinary
-from server.helpers.filter import filter_bookings
+from server.helpers.uploads import collect_uploaded_images, get_request_data
+from server.helpers.filter import bookings_by_service
+from server.helpers.serializers import serialize_service
 from . import services_bp
 
 api = Api(services_bp)
@@ -16,57 +16,70 @@ api = Api(services_bp)
 class ServiceListResource(Resource):
     @jwt_required(optional=True)
     def get(self):
-        current_user_email = get_jwt_identity()
         services = Service.query.all()
-        services_list = [filter_bookings(s.to_dict(), current_user_email) for s in services]
+        # Only the caller's own bookings are loaded, with a SQL filter;
+        # anonymous callers get none and the booking table is never queried.
+        visible_bookings = bookings_by_service([s.id for s in services], get_jwt_identity())
+        services_list = [serialize_service(s, visible_bookings[s.id]) for s in services]
         return services_list, 200
 
     @jwt_required()
     def post(self):
-        name = request.form.get("name")
-        description = request.form.get("description")
-        price = request.form.get("price")
-        alt_text = request.form.get("alt_text", "").strip() or None
-        files = request.files.getlist("images")
+        data = get_request_data()
+        name = data.get("name")
+        description = data.get("description")
+        price = data.get("price")
+        alt_text = (data.get("alt_text") or "").strip() or None
 
         if not name:
             return {"error": "Service name is required"}, 400
-        if not files:
-            return {"error": "At least one image is required"}, 400
 
-        # Upload the first image
-        uploaded = upload_files_to_cloudinary(files, folder="radam-construction/services")
-        image_url = uploaded[0]["secure_url"]
+        # Upload the first image, or accept one the client uploaded directly
+        try:
+            uploaded = collect_uploaded_images("images", folder="radam-construction/services")
+        except ValueError as error:
+            return {"error": str(error)}, 400
+
+        if not uploaded:
+            return {"error": "At least one image is required"}, 400
 
         service = Service(
             name=name.strip(),
             description=description,
             price=price,
-            image_url=image_url,
+            image_url=uploaded[0]["secure_url"],
+            image_public_id=uploaded[0]["public_id"],
+            image_width=uploaded[0]["width"],
+            image_height=uploaded[0]["height"],
             alt_text=alt_text,
         )
         db.session.add(service)
         db.session.commit()
 
-        return service.to_dict(), 201
+        return serialize_service(service), 201
 
 
 class ServiceResource(Resource):
     @jwt_required(optional=True)
     def get(self, service_id):
         service = Service.query.get_or_404(service_id)
-        current_user_email = get_jwt_identity()
-        return filter_bookings(service.to_dict(), current_user_email), 200
+        visible_bookings = bookings_by_service([service.id], get_jwt_identity())
+        return serialize_service(service, visible_bookings[service.id]), 200
 
     @jwt_required()
     def put(self, service_id):
         service = Service.query.get_or_404(service_id)
 
-        name = request.form.get("name")
-        description = request.form.get("description")
-        price = request.form.get("price")
-        alt_text = request.form.get("alt_text", "").strip() or None
-        files = request.files.getlist("images")
+        data = get_request_data()
+        name = data.get("name")
+        description = data.get("description")
+        price = data.get("price")
+        alt_text = (data.get("alt_text") or "").strip() or None
+
+        try:
+            uploaded = collect_uploaded_images("images", folder="radam-construction/services")
+        except ValueError as error:
+            return {"error": str(error)}, 400
 
         if name:
             service.name = name.strip()
@@ -76,12 +89,14 @@ class ServiceResource(Resource):
             service.price = price
         service.alt_text = alt_text
 
-        if files:
-            uploaded = upload_files_to_cloudinary(files, folder="radam-construction/services")
+        if uploaded:
             service.image_url = uploaded[0]["secure_url"]
+            service.image_public_id = uploaded[0]["public_id"]
+            service.image_width = uploaded[0]["width"]
+            service.image_height = uploaded[0]["height"]
 
         db.session.commit()
-        return service.to_dict(), 200
+        return serialize_service(service), 200
 
     @jwt_required()
     def delete(self, service_id):
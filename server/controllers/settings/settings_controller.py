@@ -3,7 +3,9 @@ from flask import request
 from flask_restful import Api, Resource
 from flask_jwt_extended import jwt_required
 from server.extension import db
+from server.helpers.reviews import MAX_REVIEW_LIMIT, REVIEW_SORTS, normalize_reviews
 from server.models import SiteSetting
+from server.service.settings_service import get_settings, refresh_settings
 from . import settings_bp
 
 api = Api(settings_bp)
@@ -11,8 +13,20 @@ api = Api(settings_bp)
 
 class PublicSettingsResource(Resource):
     def get(self):
-        settings = SiteSetting.get_singleton()
-        return settings.to_public_dict(), 200
+        sort = request.args.get("sort", "default")
+        if sort not in REVIEW_SORTS:
+            return {"error": f"sort must be one of: {', '.join(REVIEW_SORTS)}"}, 400
+
+        limit = request.args.get("limit")
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except ValueError:
+                return {"error": "limit must be a number"}, 400
+            if not 1 <= limit <= MAX_REVIEW_LIMIT:
+                return {"error": f"limit must be between 1 and {MAX_REVIEW_LIMIT}"}, 400
+
+        return get_settings().to_public_dict(sort=sort, limit=limit), 200
 
 
 class SiteSettingsResource(Resource):
@@ -28,25 +42,28 @@ class SiteSettingsResource(Resource):
 
         whatsapp_number = (data.get("whatsapp_number") or "").strip()
         google_business_name = (data.get("google_business_name") or "").strip()
+        # Reviews come as a list, or as JSON text from the admin form.
+        google_reviews = data.get("google_reviews")
         google_reviews_json = data.get("google_reviews_json") or ""
 
-        if google_reviews_json:
+        if google_reviews is None and google_reviews_json.strip():
             try:
-                parsed_reviews = json.loads(google_reviews_json)
+                google_reviews = json.loads(google_reviews_json)
             except ValueError:
                 return {"error": "Google reviews must be valid JSON"}, 400
 
-            if not isinstance(parsed_reviews, list):
-                return {"error": "Google reviews JSON must be an array"}, 400
-        else:
-            google_reviews_json = ""
+        try:
+            google_reviews = normalize_reviews(google_reviews)
+        except ValueError as error:
+            return {"error": str(error)}, 400
 
         settings.whatsapp_number = whatsapp_number or None
         settings.google_business_name = google_business_name or None
-        settings.google_reviews_json = google_reviews_json
+        settings.google_reviews = google_reviews or None
 
         db.session.add(settings)
         db.session.commit()
+        refresh_settings(settings)
 
         return settings.to_admin_dict(), 200
 
@@ -0,0 +1,5 @@
+from flask import Blueprint
+
+sync_bp = Blueprint("sync_bp", __name__)
+
+from . import sync_controller
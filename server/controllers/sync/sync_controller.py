@@ -0,0 +1,177 @@
+import base64
+import json
+from datetime import datetime, timedelta
+from flask import request
+from flask_restful import Api, Resource
+from flask_jwt_extended import jwt_required
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import joinedload, selectinload
+from server.models import Booking, Contact, Tombstone, User
+from server.helpers.pagination import parse_limit
+from server.helpers.serializers import serialize_booking, serialize_user
+from server.service.sync_service import tombstone_cutoff
+from . import sync_bp
+
+api = Api(sync_bp)
+
+SYNC_PAGE_SIZE = 500
+# Rows committed slightly after a poll can carry an older updated_at. The
+# cursor never moves past "now - SYNC_LAG", so those rows are picked up by the
+# next poll; clients upsert by id, so a re-sent row is harmless.
+SYNC_LAG = timedelta(seconds=2)
+
+SYNC_ENTITIES = {
+    "bookings": (
+        Booking,
+        lambda query: query.options(joinedload(Booking.service), joinedload(Booking.assigned_user)),
+        serialize_booking,
+    ),
+    "contacts": (Contact, lambda query: query, lambda contact: contact.to_dict()),
+    "users": (
+        User,
+        lambda query: query.options(selectinload(User.assigned_bookings).joinedload(Booking.service)),
+        serialize_user,
+    ),
+}
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _encode_position(position):
+    return [position[0].isoformat(), position[1]]
+
+
+def _decode_position(value):
+    timestamp, row_id = value
+    return datetime.fromisoformat(timestamp), int(row_id)
+
+
+def _encode_cursor(state):
+    payload = {name: _encode_position(position) for name, position in state["entities"].items()}
+    if state["tombstone"] is not None:
+        payload["tombstone"] = _encode_position(state["tombstone"])
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor):
+    # A tombstone position of None means "from the oldest tombstone kept":
+    # first syncs, and cursors from before tombstones were keyed by time.
+    state = {
+        "entities": {name: (_EPOCH, 0) for name in SYNC_ENTITIES},
+        "tombstone": None,
+    }
+    if not cursor:
+        return state
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        for name in SYNC_ENTITIES:
+            if name in payload:
+                state["entities"][name] = _decode_position(payload[name])
+        if isinstance(payload.get("tombstone"), list):
+            state["tombstone"] = _decode_position(payload["tombstone"])
+    except (TypeError, ValueError, AttributeError) as error:
+        raise ValueError("Invalid sync cursor") from error
+    return state
+
+
+def _changed_rows(model, load_options, position, limit):
+    updated_at, row_id = position
+    rows = (
+        load_options(model.query)
+        .filter(
+            or_(
+                model.updated_at > updated_at,
+                and_(model.updated_at == updated_at, model.id > row_id),
+            )
+        )
+        .order_by(model.updated_at.asc(), model.id.asc())
+        .limit(limit + 1)
+        .all()
+    )
+    has_more = len(rows) > limit
+    return rows[:limit], has_more
+
+
+def _next_position(rows, has_more, position, watermark, timestamp="updated_at"):
+    if has_more:
+        return getattr(rows[-1], timestamp), rows[-1].id
+    if rows and getattr(rows[-1], timestamp) <= watermark:
+        return getattr(rows[-1], timestamp), rows[-1].id
+    return max(position, (watermark, 0))
+
+
+def _deleted_rows(position, limit):
+    # Ids are handed out before commit, so a tombstone can become visible
+    # with an id below one already synced; paging by (deleted_at, id) behind
+    # the same watermark as updates avoids skipping it.
+    query = Tombstone.query.filter(Tombstone.entity.in_(list(SYNC_ENTITIES)))
+    if position is not None:
+        deleted_at, row_id = position
+        query = query.filter(
+            or_(
+                Tombstone.deleted_at > deleted_at,
+                and_(Tombstone.deleted_at == deleted_at, Tombstone.id > row_id),
+            )
+        )
+    rows = query.order_by(Tombstone.deleted_at.asc(), Tombstone.id.asc()).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    return rows[:limit], has_more
+
+
+class SyncResource(Resource):
+    @jwt_required()
+    def get(self):
+        try:
+            state = _decode_cursor(request.args.get("since"))
+            limit = parse_limit(request.args.get("limit"), default=SYNC_PAGE_SIZE, maximum=SYNC_PAGE_SIZE)
+        except ValueError as error:
+            return {"error": str(error)}, 400
+
+        now = datetime.utcnow()
+        if state["tombstone"] is not None and state["tombstone"][0] < tombstone_cutoff(now):
+            # Deletions this client has not seen may already be pruned.
+            return {
+                "changes": {name: [] for name in SYNC_ENTITIES},
+                "deleted": {name: [] for name in SYNC_ENTITIES},
+                "cursor": None,
+                "has_more": False,
+                "full_resync": True,
+            }, 200
+
+        watermark = now - SYNC_LAG
+        changes = {}
+        has_more = False
+
+        for name, (model, load_options, serialize) in SYNC_ENTITIES.items():
+            position = state["entities"][name]
+            rows, entity_has_more = _changed_rows(model, load_options, position, limit)
+            changes[name] = [serialize(row) for row in rows]
+            state["entities"][name] = _next_position(rows, entity_has_more, position, watermark)
+            has_more = has_more or entity_has_more
+
+        tombstones, tombstones_have_more = _deleted_rows(state["tombstone"], limit)
+        has_more = has_more or tombstones_have_more
+
+        deleted = {name: [] for name in SYNC_ENTITIES}
+        for tombstone in tombstones:
+            deleted[tombstone.entity].append(tombstone.entity_id)
+        state["tombstone"] = _next_position(
+            tombstones,
+            tombstones_have_more,
+            state["tombstone"] or (_EPOCH, 0),
+            watermark,
+            timestamp="deleted_at",
+        )
+
+        return {
+            "changes": changes,
+            "deleted": deleted,
+            "cursor": _encode_cursor(state),
+            "has_more": has_more,
+            "full_resync": False,
+        }, 200
+
+
+api.add_resource(SyncResource, "/sync")
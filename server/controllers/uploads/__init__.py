@@ -0,0 +1,5 @@
+from flask import Blueprint
+
+uploads_bp = Blueprint("uploads_bp", __name__)
+
+from . import upload_controller
@@ -0,0 +1,41 @@
+from flask import abort, request, send_from_directory
+from flask_restful import Api, Resource
+from flask_jwt_extended import jwt_required
+from server.service.cloudinary_service import (
+    DIRECT_UPLOAD_FOLDERS,
+    generate_upload_signature,
+)
+from server.service.storage_service import LocalStorage, get_storage
+from . import uploads_bp
+
+api = Api(uploads_bp)
+
+
+class UploadSignatureResource(Resource):
+    @jwt_required()
+    def post(self):
+        data = request.get_json() or {}
+        target = (data.get("target") or "").strip()
+
+        folder = DIRECT_UPLOAD_FOLDERS.get(target)
+        if not folder:
+            return {
+                "error": f"target must be one of: {', '.join(sorted(DIRECT_UPLOAD_FOLDERS))}"
+            }, 400
+
+        try:
+            return generate_upload_signature(folder), 200
+        except RuntimeError as error:
+            return {"error": str(error)}, 500
+
+
+@uploads_bp.route("/media/<path:filename>")
+def local_media(filename):
+    # Only the local storage backend keeps files on this server.
+    storage = get_storage()
+    if not isinstance(storage, LocalStorage):
+        abort(404)
+    return send_from_directory(storage.root, filename)
+
+
+api.add_resource(UploadSignatureResource, "/uploads/signature")
@@ -1,30 +1,36 @@
 from flask import request
 from flask_jwt_extended import get_jwt_identity, jwt_required
 from flask_restful import Api, Resource
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
 
 from server.extension import db
-from server.models import User
+from server.models import Booking, User
+from server.models.user import normalize_email
+from server.helpers.serializers import serialize_user
 
 from . import users_bp
 
 api = Api(users_bp)
 
 
-def _normalize_email(email):
-    return (email or "").strip().lower()
-
-
 class UserListResource(Resource):
     @jwt_required()
     def get(self):
-        users = User.query.order_by(User.username.asc()).all()
-        return [user.to_dict() for user in users], 200
+        users = (
+            User.query.options(
+                selectinload(User.assigned_bookings).joinedload(Booking.service)
+            )
+            .order_by(User.username.asc())
+            .all()
+        )
+        return [serialize_user(user) for user in users], 200
 
     @jwt_required()
     def post(self):
         data = request.get_json() or {}
         username = (data.get("username") or "").strip()
-        email = _normalize_email(data.get("email"))
+        email = normalize_email(data.get("email"))
         password = data.get("password") or ""
 
         if not username:
@@ -33,15 +39,20 @@ class UserListResource(Resource):
             return {"error": "Email is required"}, 400
         if len(password) < 8:
             return {"error": "Password must be at least 8 characters"}, 400
-        if User.query.filter_by(email=email).first():
+        if User.find_by_email(email):
             return {"error": "A team member with that email already exists"}, 400
 
         user = User(username=username, email=email)
         user.set_password(password)
         db.session.add(user)
-        db.session.commit()
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # Another request added the same email after our check.
+            db.session.rollback()
+            return {"error": "A team member with that email already exists"}, 400
 
-        return user.to_dict(), 201
+        return serialize_user(user), 201
 
 
 class UserResource(Resource):
@@ -52,7 +63,7 @@ class UserResource(Resource):
         data = request.get_json() or {}
 
         username = (data.get("username") or "").strip()
-        email = _normalize_email(data.get("email"))
+        email = normalize_email(data.get("email"))
         password = data.get("password") or ""
 
         if not username:
@@ -60,8 +71,8 @@ class UserResource(Resource):
         if not email:
             return {"error": "Email is required"}, 400
 
-        existing_user = User.query.filter(User.email == email, User.id != user_id).first()
-        if existing_user:
+        existing_user = User.find_by_email(email)
+        if existing_user and existing_user.id != user_id:
             return {"error": "A team member with that email already exists"}, 400
 
         user.username = username
@@ -74,8 +85,12 @@ class UserResource(Resource):
                 return {"error": "Password must be at least 8 characters"}, 400
             user.set_password(password)
 
-        db.session.commit()
-        return user.to_dict(), 200
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            return {"error": "A team member with that email already exists"}, 400
+        return serialize_user(user), 200
 
     @jwt_required()
     def delete(self, user_id):
@@ -0,0 +1,44 @@
+MAX_BULK_IDS = 500
+
+
+def parse_bulk_request(data, allowed_fields):
+    ids = data.get("ids")
+    patch = data.get("patch")
+
+    if not isinstance(ids, list) or not ids:
+        raise ValueError("ids must be a non-empty list")
+    if len(ids) > MAX_BULK_IDS:
+        raise ValueError(f"At most {MAX_BULK_IDS} ids can be updated at once")
+    try:
+        ids = sorted({int(value) for value in ids})
+    except (TypeError, ValueError) as error:
+        raise ValueError("ids must be numbers") from error
+
+    if not isinstance(patch, dict) or not patch:
+        raise ValueError("patch must be a non-empty object")
+    unknown = set(patch) - set(allowed_fields)
+    if unknown:
+        raise ValueError(f"Unsupported fields: {', '.join(sorted(unknown))}")
+
+    return ids, patch
+
+
+def bulk_update(model, ids, values, session):
+    """Apply ``values`` to every row in ``ids`` with one UPDATE statement."""
+    found_ids = {
+        row_id for (row_id,) in session.query(model.id).filter(model.id.in_(ids)).all()
+    }
+    updated = 0
+    if found_ids:
+        updated = (
+            session.query(model)
+            .filter(model.id.in_(found_ids))
+            .update(values, synchronize_session=False)
+        )
+    session.commit()
+
+    return {
+        "requested": len(ids),
+        "updated": updated,
+        "not_found": [row_id for row_id in ids if row_id not in found_ids],
+    }
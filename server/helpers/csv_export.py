@@ -0,0 +1,59 @@
+import csv
+import io
+import re
+from datetime import datetime
+from flask import Response, stream_with_context
+from server.extension import db
+
+EXPORT_BATCH_SIZE = 1000
+# Cells starting with these are evaluated as formulas by spreadsheet apps.
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+# A leading + or - is harmless on a plain number such as "+254 712 345 678",
+# so phone numbers and negative amounts are exported unchanged.
+PLAIN_NUMBER = re.compile(r"[+-][\d\s().]*\d[\d\s().]*")
+
+
+def _cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ", timespec="seconds")
+    if (
+        isinstance(value, str)
+        and value.startswith(FORMULA_PREFIXES)
+        and not PLAIN_NUMBER.fullmatch(value)
+    ):
+        return "'" + value
+    return value
+
+
+def _generate_csv(statement, header):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+
+    # yield_per streams rows from a server-side cursor, so only one batch is
+    # held in memory at a time.
+    result = db.session.execute(statement.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    for rows in result.partitions():
+        for row in rows:
+            writer.writerow([_cell(value) for value in row])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def csv_response(statement, header, name):
+    """Stream the rows of a column-only ``select()`` as a CSV download."""
+    filename = f"{name}-{datetime.utcnow():%Y%m%d-%H%M%S}.csv"
+    return Response(
+        stream_with_context(_generate_csv(statement, header)),
+        mimetype="text/csv",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Cache-Control": "no-store",
+        },
+    )
@@ -1,9 +1,34 @@
+from sqlalchemy import func
+from sqlalchemy.orm import joinedload
+from server.models import Booking, User
 
-def filter_bookings(service_dict, current_user_email):
-    if current_user_email:
-        service_dict["bookings"] = [
-            b for b in service_dict["bookings"] if b["email"] == current_user_email
-        ]
-    else:
-        service_dict["bookings"] = []
-    return service_dict
\ No newline at end of file
+
+def _identity_email(identity):
+    # JWT identities are user ids; older tokens may still carry an email.
+    if not identity:
+        return None
+    if isinstance(identity, str) and "@" in identity:
+        return identity.strip().lower()
+    user = User.query.get(identity)
+    return user.email.strip().lower() if user and user.email else None
+
+
+def bookings_by_service(service_ids, identity):
+    """Bookings visible to ``identity`` for the given services, grouped by service id.
+
+    Anonymous callers see none, so the booking table is not touched at all.
+    """
+    grouped = {service_id: [] for service_id in service_ids}
+    email = _identity_email(identity)
+    if not email or not service_ids:
+        return grouped
+
+    bookings = (
+        Booking.query.options(joinedload(Booking.assigned_user))
+        .filter(Booking.service_id.in_(service_ids), func.lower(Booking.email) == email)
+        .order_by(Booking.id.asc())
+        .all()
+    )
+    for booking in bookings:
+        grouped[booking.service_id].append(booking)
+    return grouped
@@ -0,0 +1,70 @@
+from functools import lru_cache
+from urllib.parse import urlparse
+from cloudinary.utils import cloudinary_url
+
+# Widths offered to clients; each is a c_limit resize, so small originals are
+# never upscaled.
+IMAGE_VARIANT_WIDTHS = (320, 640, 960, 1200)
+CLOUDINARY_HOST = "res.cloudinary.com"
+
+
+def _cloud_name(url):
+    parsed = urlparse(url or "")
+    if parsed.netloc != CLOUDINARY_HOST:
+        return None
+    return parsed.path.strip("/").split("/", 1)[0] or None
+
+
+def _variant_widths(width):
+    if not width:
+        return IMAGE_VARIANT_WIDTHS
+    widths = tuple(w for w in IMAGE_VARIANT_WIDTHS if w < width)
+    return widths + (min(width, IMAGE_VARIANT_WIDTHS[-1]),)
+
+
+@lru_cache(maxsize=4096)
+def _variant_urls(cloud_name, public_id, widths):
+    # URL building is pure string work, but it runs for every image in every
+    # listing; the cache turns repeat responses into dict lookups.
+    return tuple(
+        cloudinary_url(
+            public_id,
+            cloud_name=cloud_name,
+            secure=True,
+            resource_type="image",
+            transformation=[
+                {"width": width, "crop": "limit", "quality": "auto", "fetch_format": "auto"}
+            ],
+        )[0]
+        for width in widths
+    )
+
+
+def image_metadata(url, public_id=None, width=None, height=None):
+    """Describe an image with its size and responsive Cloudinary variants.
+
+    Images not hosted on Cloudinary (seed data, local storage) come back with
+    no variants, so clients fall back to ``url``.
+    """
+    if not url:
+        return None
+
+    variants = []
+    cloud_name = _cloud_name(url)
+    if cloud_name and public_id:
+        widths = _variant_widths(width)
+        for variant_width, variant_url in zip(widths, _variant_urls(cloud_name, public_id, widths)):
+            variants.append({
+                "width": variant_width,
+                "height": round(height * variant_width / width) if width and height else None,
+                "url": variant_url,
+            })
+
+    return {
+        "url": url,
+        "public_id": public_id,
+        "width": width,
+        "height": height,
+        "variants": variants,
+        "srcset": ", ".join(f"{v['url']} {v['width']}w" for v in variants) or None,
+    }
@@ -0,0 +1,75 @@
+MAX_REVIEWS = 100
+MAX_REVIEW_TEXT_LENGTH = 5000
+REVIEW_SORTS = ("default", "rating", "newest")
+MAX_REVIEW_LIMIT = 50
+
+# Field -> type for a stored review. Names follow the Google Places API so
+# reviews can be pasted straight from it.
+REVIEW_FIELDS = {
+    "id": str,
+    "author_name": str,
+    "author_url": str,
+    "profile_photo_url": str,
+    "rating": int,
+    "text": str,
+    "relative_time_description": str,
+    "time": int,
+}
+# Older hand-written entries used these names.
+REVIEW_ALIASES = {"name": "author_name", "comment": "text"}
+
+
+def _field(value, kind, name, index):
+    if value is None or value == "":
+        return None
+    if kind is str:
+        if not isinstance(value, (str, int)):
+            raise ValueError(f"Review {index + 1}: {name} must be text")
+        value = str(value).strip()
+        if len(value) > MAX_REVIEW_TEXT_LENGTH:
+            raise ValueError(f"Review {index + 1}: {name} is too long")
+        return value or None
+    if isinstance(value, bool):
+        raise ValueError(f"Review {index + 1}: {name} must be a number")
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        raise ValueError(f"Review {index + 1}: {name} must be a number")
+
+
+def normalize_review(entry, index=0):
+    if not isinstance(entry, dict):
+        raise ValueError(f"Review {index + 1} must be an object")
+
+    review = {}
+    for key, value in entry.items():
+        key = REVIEW_ALIASES.get(key, key)
+        if key in REVIEW_FIELDS and review.get(key) is None:
+            review[key] = _field(value, REVIEW_FIELDS[key], key, index)
+    review = {key: value for key, value in review.items() if value is not None}
+
+    if "rating" in review and not 1 <= review["rating"] <= 5:
+        raise ValueError(f"Review {index + 1}: rating must be between 1 and 5")
+    if "text" not in review and "rating" not in review:
+        raise ValueError(f"Review {index + 1} needs a text or a rating")
+    return review
+
+
+def normalize_reviews(entries):
+    """Validate a list of reviews and keep only the known, typed fields."""
+    if entries is None:
+        return []
+    if not isinstance(entries, list):
+        raise ValueError("Google reviews must be an array")
+    if len(entries) > MAX_REVIEWS:
+        raise ValueError(f"At most {MAX_REVIEWS} Google reviews can be stored")
+    return [normalize_review(entry, index) for index, entry in enumerate(entries)]
+
+
+def sort_reviews(reviews, sort):
+    """Order reviews for display; "default" keeps the order the admin saved."""
+    if sort == "rating":
+        return sorted(reviews, key=lambda review: (-review.get("rating", 0), -review.get("time", 0)))
+    if sort == "newest":
+        return sorted(reviews, key=lambda review: -review.get("time", 0))
+    return list(reviews)
@@ -0,0 +1,38 @@
+import re
+from sqlalchemy import column, text
+from server.extension import db
+from server.models import Contact
+from server.models.contact import (
+    CONTACT_FTS_TABLE,
+    CONTACT_SEARCH_CONFIG,
+    CONTACT_SEARCH_VECTOR,
+)
+
+MAX_SEARCH_TERMS = 8
+# Words, plus the punctuation that appears inside emails and phone numbers.
+SEARCH_TERM = re.compile(r"[\w@.+-]*\w[\w@.+-]*")
+
+
+def search_terms(value):
+    return SEARCH_TERM.findall(value or "")[:MAX_SEARCH_TERMS]
+
+
+def filter_contacts_search(query, value):
+    """Keep contacts matching every term in ``value``, each as a prefix."""
+    terms = search_terms(value)
+    if not terms:
+        return query
+
+    if db.engine.dialect.name == "postgresql":
+        tsquery = " & ".join(f"'{term}':*" for term in terms)
+        return query.filter(
+            text(
+                f"{CONTACT_SEARCH_VECTOR} @@ to_tsquery('{CONTACT_SEARCH_CONFIG}', :contact_search)"
+            ).bindparams(contact_search=tsquery)
+        )
+
+    match = " ".join(f'"{term}"*' for term in terms)
+    matching_ids = text(
+        f"SELECT rowid FROM {CONTACT_FTS_TABLE} WHERE {CONTACT_FTS_TABLE} MATCH :contact_search"
+    ).bindparams(contact_search=match).columns(column("rowid"))
+    return query.filter(Contact.id.in_(matching_ids))
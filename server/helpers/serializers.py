@@ -0,0 +1,105 @@
+from operator import attrgetter
+
+# Same format SerializerMixin uses, so the JSON stays identical.
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _format_datetime(value):
+    return value.strftime(DATETIME_FORMAT) if value is not None else None
+
+
+def _columns(*fields, datetimes=()):
+    """Build a serializer for a fixed set of columns.
+
+    The attribute getter and field list are resolved once at import time, so
+    each call is a single tuple fetch plus a dict build.
+    """
+    getter = attrgetter(*fields)
+
+    def serialize(obj):
+        data = dict(zip(fields, getter(obj)))
+        for field in datetimes:
+            data[field] = _format_datetime(data[field])
+        return data
+
+    return serialize
+
+
+_user_columns = _columns("id", "username", "email", "updated_at", datetimes=("updated_at",))
+_service_columns = _columns(
+    "id", "name", "description", "price", "image_url", "image_public_id",
+    "image_width", "image_height", "image", "alt_text",
+    "created_at", "updated_at",
+    datetimes=("created_at", "updated_at"),
+)
+_booking_columns = _columns(
+    "id", "name", "phone", "email", "message", "status", "is_read", "responded_at",
+    "created_at", "updated_at", "service_id", "assigned_user_id",
+    datetimes=("responded_at", "created_at", "updated_at"),
+)
+_portfolio_item_columns = _columns(
+    "id", "tittle", "description", "image_url", "image_public_id", "image_width",
+    "image_height", "image", "alt_text",
+    "created_at", "updated_at",
+    datetimes=("created_at", "updated_at"),
+)
+_portfolio_image_columns = _columns(
+    "id", "image_url", "public_id", "width", "height", "image", "position",
+    "portfolio_id", "updated_at",
+    datetimes=("updated_at",),
+)
+
+
+def serialize_user(user):
+    """Same shape as ``User.to_dict()``."""
+    data = _user_columns(user)
+    data["assigned_bookings"] = [
+        serialize_booking(booking, include_assigned_user=False)
+        for booking in user.assigned_bookings
+    ]
+    return data
+
+
+def serialize_service(service, bookings=None):
+    """Same shape as ``Service.to_dict()``.
+
+    Pass ``bookings`` to serialize a pre-filtered list instead of the whole
+    relationship.
+    """
+    data = _service_columns(service)
+    if bookings is None:
+        bookings = service.bookings
+    data["bookings"] = [
+        serialize_booking(booking, include_service=False) for booking in bookings
+    ]
+    return data
+
+
+def serialize_booking(booking, include_service=True, include_assigned_user=True):
+    """Same shape as ``Booking.to_dict(rules=("-service.bookings",))``."""
+    data = _booking_columns(booking)
+    if include_service:
+        service = booking.service
+        data["service"] = _service_columns(service) if service is not None else None
+    if include_assigned_user:
+        user = booking.assigned_user
+        data["assigned_user"] = _user_columns(user) if user is not None else None
+    return data
+
+
+def serialize_portfolio_image(image):
+    return _portfolio_image_columns(image)
+
+
+def serialize_portfolio_item(item):
+    """Same shape as ``PortfolioItem.to_dict(rules=("-images.portfolio",))``."""
+    data = _portfolio_item_columns(item)
+    data["images"] = [serialize_portfolio_image(image) for image in item.images]
+    return data
+
+
+def serialize_portfolio_summary(item, image_count):
+    """Cover-only shape for gallery grids: no image list, just its size."""
+    data = _portfolio_item_columns(item)
+    data["image_count"] = image_count
+    return data
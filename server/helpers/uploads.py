@@ -0,0 +1,46 @@
+from flask import request
+from server.service.cloudinary_service import (
+    upload_files_to_cloudinary,
+    resolve_uploaded_images,
+)
+
+
+def is_multipart_request():
+    return bool(request.content_type and "multipart/form-data" in request.content_type)
+
+
+def get_request_data():
+    if is_multipart_request():
+        return request.form
+    return request.get_json(silent=True) or {}
+
+
+def _incoming_files(field):
+    return [file for file in request.files.getlist(field) if file and file.filename]
+
+
+def count_uploaded_images(field):
+    """How many images collect_uploaded_images would return, without uploading."""
+    files = _incoming_files(field)
+    if files:
+        return len(files)
+    if not is_multipart_request():
+        entries = get_request_data().get(field)
+        if entries:
+            return len(entries) if isinstance(entries, list) else 1
+    return 0
+
+
+def collect_uploaded_images(field, folder):
+    # Multipart files are re-uploaded from the server; JSON bodies carry the
+    # public_ids/URLs of images the client already sent straight to Cloudinary.
+    files = _incoming_files(field)
+    if files:
+        return upload_files_to_cloudinary(files, folder=folder)
+
+    if not is_multipart_request():
+        entries = get_request_data().get(field)
+        if entries:
+            return resolve_uploaded_images(entries, folder=folder)
+
+    return []
@@ -8,3 +8,12 @@ from .contact import Contact
 from .site_setting import SiteSetting
 from .hardware_category import HardwareCategory
 from .hardware_item import HardwareItem
+from .uploaded_asset import UploadedAsset
+from .daily_rollup import DailyRollup
+from .idempotency_record import IdempotencyRecord
+from .archived_record import ArchivedRecord
+from .tombstone import Tombstone, track_deletes
+
+track_deletes(Booking, "bookings")
+track_deletes(Contact, "contacts")
+track_deletes(User, "users")
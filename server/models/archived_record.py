@@ -0,0 +1,31 @@
+from datetime import datetime
+from server.extension import db
+
+
+class ArchivedRecord(db.Model):
+    """A booking or contact moved out of the hot tables by the archive job.
+
+    ``data`` holds the row as the API served it, so archived records read
+    back in the same shape. ``status``, ``is_read``, ``responded_at`` and
+    ``service_id`` are copied out of it so the daily rollups can keep
+    counting archived rows.
+    """
+
+    __tablename__ = "archived_records"
+    __table_args__ = (
+        db.UniqueConstraint("entity", "entity_id", name="uq_archived_records_entity_id"),
+        db.Index("ix_archived_records_entity_created_at_id", "entity", "created_at", "id"),
+        db.Index("ix_archived_records_entity_email", "entity", "email"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    entity = db.Column(db.String(30), nullable=False)
+    entity_id = db.Column(db.Integer, nullable=False)
+    email = db.Column(db.String(120), nullable=True)
+    created_at = db.Column(db.DateTime, nullable=True)
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    status = db.Column(db.String(20), nullable=True)
+    is_read = db.Column(db.Boolean, nullable=True)
+    responded_at = db.Column(db.DateTime, nullable=True)
+    service_id = db.Column(db.Integer, nullable=True)
+    data = db.Column(db.Text, nullable=False)
@@ -3,6 +3,16 @@ from sqlalchemy_serializer import SerializerMixin
 from datetime import datetime
 
 class Booking(db.Model, SerializerMixin):
+    __table_args__ = (
+        db.Index("ix_booking_created_at_id", "created_at", "id"),
+        db.Index("ix_booking_status_created_at_id", "status", "created_at", "id"),
+        db.Index("ix_booking_is_read_created_at_id", "is_read", "created_at", "id"),
+        db.Index(
+            "ix_booking_assigned_user_id_created_at_id", "assigned_user_id", "created_at", "id"
+        ),
+        db.Index("ix_booking_service_id_created_at_id", "service_id", "created_at", "id"),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(120), nullable=False)
     phone = db.Column(db.String(20), nullable=False)
@@ -10,7 +20,12 @@ class Booking(db.Model, SerializerMixin):
     message = db.Column(db.Text, nullable=True)
     status = db.Column(db.String(20), default="pending")  
     is_read = db.Column(db.Boolean, default=False, nullable=False)
+    # First time the booking was read or moved off "pending".
+    responded_at = db.Column(db.DateTime, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(
+        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True
+    )
 
     serialize_rules = ("-service.bookings", "-assigned_user.assigned_bookings")
 
@@ -1,8 +1,13 @@
 from server.extension import db
+from sqlalchemy import DDL, event
 from datetime import datetime
 
 class Contact(db.Model):
     __tablename__ = "contacts"
+    __table_args__ = (
+        db.Index("ix_contacts_created_at_id", "created_at", "id"),
+        db.Index("ix_contacts_is_read_created_at_id", "is_read", "created_at", "id"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
@@ -11,7 +16,12 @@ class Contact(db.Model):
     subject = db.Column(db.String(100), nullable=False)
     message = db.Column(db.Text, nullable=False)
     is_read = db.Column(db.Boolean, default=False, nullable=False)
+    # First time the message was marked read.
+    responded_at = db.Column(db.DateTime, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(
+        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True
+    )
 
     def to_dict(self):
         return {
@@ -22,5 +32,55 @@ class Contact(db.Model):
             "subject": self.subject,
             "message": self.message,
             "is_read": self.is_read,
-            "created_at": self.created_at.isoformat()
+            "responded_at": self.responded_at.isoformat() if self.responded_at else None,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
+
+
+# Full-text search over the inbox. Postgres uses a GIN index on a tsvector
+# expression; queries must repeat CONTACT_SEARCH_DOCUMENT verbatim to use it.
+# SQLite uses an external-content FTS5 table kept in sync by triggers. Keep
+# the migration that creates these in step with the statements below.
+CONTACT_SEARCH_CONFIG = "simple"
+CONTACT_SEARCH_DOCUMENT = (
+    "coalesce(name, '') || ' ' || coalesce(email, '') || ' ' || coalesce(phone, '')"
+    " || ' ' || coalesce(subject, '') || ' ' || coalesce(message, '')"
+)
+CONTACT_SEARCH_VECTOR = f"to_tsvector('{CONTACT_SEARCH_CONFIG}', {CONTACT_SEARCH_DOCUMENT})"
+CONTACT_FTS_TABLE = "contacts_fts"
+CONTACT_FTS_COLUMNS = "name, email, phone, subject, message"
+
+POSTGRES_SEARCH_DDL = (
+    f"CREATE INDEX ix_contacts_search ON contacts USING gin ({CONTACT_SEARCH_VECTOR})",
+)
+SQLITE_SEARCH_DDL = (
+    f"CREATE VIRTUAL TABLE {CONTACT_FTS_TABLE} USING fts5("
+    f"{CONTACT_FTS_COLUMNS}, content='contacts', content_rowid='id')",
+    f"""CREATE TRIGGER contacts_fts_ai AFTER INSERT ON contacts BEGIN
+        INSERT INTO {CONTACT_FTS_TABLE}(rowid, {CONTACT_FTS_COLUMNS})
+        VALUES (new.id, new.name, new.email, new.phone, new.subject, new.message);
+    END""",
+    f"""CREATE TRIGGER contacts_fts_ad AFTER DELETE ON contacts BEGIN
+        INSERT INTO {CONTACT_FTS_TABLE}({CONTACT_FTS_TABLE}, rowid, {CONTACT_FTS_COLUMNS})
+        VALUES ('delete', old.id, old.name, old.email, old.phone, old.subject, old.message);
+    END""",
+    f"""CREATE TRIGGER contacts_fts_au AFTER UPDATE OF {CONTACT_FTS_COLUMNS} ON contacts BEGIN
+        INSERT INTO {CONTACT_FTS_TABLE}({CONTACT_FTS_TABLE}, rowid, {CONTACT_FTS_COLUMNS})
+        VALUES ('delete', old.id, old.name, old.email, old.phone, old.subject, old.message);
+        INSERT INTO {CONTACT_FTS_TABLE}(rowid, {CONTACT_FTS_COLUMNS})
+        VALUES (new.id, new.name, new.email, new.phone, new.subject, new.message);
+    END""",
+)
+
+for statement in POSTGRES_SEARCH_DDL:
+    event.listen(
+        Contact.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql")
+    )
+for statement in SQLITE_SEARCH_DDL:
+    event.listen(Contact.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+event.listen(
+    Contact.__table__,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {CONTACT_FTS_TABLE}").execute_if(dialect="sqlite"),
+)
@@ -0,0 +1,28 @@
+from datetime import datetime
+from server.extension import db
+
+
+class DailyRollup(db.Model):
+    """Pre-aggregated booking and contact counts for one day.
+
+    One row per (kind, day, service_id, status). Bookings use their status;
+    contacts use "read" or "unread". Response times are measured from
+    created_at to responded_at and stored as a sum so averages can be
+    combined across days.
+    """
+
+    __tablename__ = "daily_rollups"
+    __table_args__ = (
+        db.Index("ix_daily_rollups_kind_day", "kind", "day"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(db.String(20), nullable=False)
+    day = db.Column(db.Date, nullable=False)
+    service_id = db.Column(db.Integer, nullable=True)
+    status = db.Column(db.String(20), nullable=False)
+    total = db.Column(db.Integer, nullable=False, default=0)
+    responded = db.Column(db.Integer, nullable=False, default=0)
+    response_seconds_total = db.Column(db.Float, nullable=False, default=0)
+    response_seconds_max = db.Column(db.Float, nullable=True)
+    refreshed_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
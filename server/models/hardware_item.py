@@ -1,5 +1,6 @@
 from datetime import datetime
 from server.extension import db
+from server.helpers.images import image_metadata
 
 
 class HardwareItem(db.Model):
@@ -11,13 +12,21 @@ class HardwareItem(db.Model):
     price = db.Column(db.Float, nullable=True)
     unit = db.Column(db.String(50), nullable=True)
     image_url = db.Column(db.String, nullable=True)
+    image_public_id = db.Column(db.String, nullable=True)
+    image_width = db.Column(db.Integer, nullable=True)
+    image_height = db.Column(db.Integer, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     category_id = db.Column(
         db.Integer, db.ForeignKey("hardware_categories.id"), nullable=False
     )
     category = db.relationship("HardwareCategory", back_populates="items")
 
+    @property
+    def image(self):
+        return image_metadata(self.image_url, self.image_public_id, self.image_width, self.image_height)
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -26,6 +35,11 @@ class HardwareItem(db.Model):
             "price": self.price,
             "unit": self.unit,
             "image_url": self.image_url,
+            "image_public_id": self.image_public_id,
+            "image_width": self.image_width,
+            "image_height": self.image_height,
+            "image": self.image,
             "category_id": self.category_id,
             "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
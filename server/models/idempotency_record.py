@@ -0,0 +1,19 @@
+from datetime import datetime
+from server.extension import db
+
+
+class IdempotencyRecord(db.Model):
+    """The stored response of a public POST, replayed when it is retried."""
+
+    __tablename__ = "idempotency_records"
+    __table_args__ = (
+        db.UniqueConstraint("scope", "key", name="uq_idempotency_records_scope_key"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    scope = db.Column(db.String(30), nullable=False)
+    key = db.Column(db.String(255), nullable=False)
+    fingerprint = db.Column(db.String(64), nullable=False)
+    status_code = db.Column(db.Integer, nullable=False)
+    response_body = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
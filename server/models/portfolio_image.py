@@ -1,17 +1,31 @@
 from server.extension import db
 from sqlalchemy_serializer import SerializerMixin
 from datetime import datetime
+from server.helpers.images import image_metadata
 
 
 
 class PortfolioImage(db.Model,SerializerMixin):
     __tablename__ = "portfolio_images"
+    __table_args__ = (
+        db.Index("ix_portfolio_images_portfolio_id_position", "portfolio_id", "position"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     image_url = db.Column(db.String(255), nullable=False) 
+    public_id = db.Column(db.String(255), nullable=True)
+    width = db.Column(db.Integer, nullable=True)
+    height = db.Column(db.Integer, nullable=True)
+    # Display order within the portfolio item; 0 is the cover.
+    position = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     portfolio_id = db.Column(db.Integer, db.ForeignKey("portfolio_items.id"), nullable=False)
     portfolio = db.relationship("PortfolioItem", back_populates="images")
     
 
-    serialize_rules = ("-portfolio.images",)
\ No newline at end of file
+    serialize_rules = ("-portfolio.images", "image")
+
+    @property
+    def image(self):
+        return image_metadata(self.image_url, self.public_id, self.width, self.height)
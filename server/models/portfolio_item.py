@@ -1,6 +1,7 @@
 from server.extension import db
 from sqlalchemy_serializer import SerializerMixin
 from datetime import datetime
+from server.helpers.images import image_metadata
 
 class PortfolioItem(db.Model,SerializerMixin):
 
@@ -10,11 +11,23 @@ class PortfolioItem(db.Model,SerializerMixin):
     tittle = db.Column(db.String,nullable=False)
     description = db.Column(db.String,nullable=False)
     image_url= db.Column(db.String,nullable=False)
+    image_public_id = db.Column(db.String,nullable=True)
+    image_width = db.Column(db.Integer,nullable=True)
+    image_height = db.Column(db.Integer,nullable=True)
     alt_text = db.Column(db.String,nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    serialize_rules = ("-images.portfolio",)
+    serialize_rules = ("-images.portfolio", "image")
 
     #  One portfolio item  many images
-    images = db.relationship("PortfolioImage", back_populates="portfolio", cascade="all, delete-orphan")
+    images = db.relationship(
+        "PortfolioImage",
+        back_populates="portfolio",
+        cascade="all, delete-orphan",
+        order_by="[PortfolioImage.position, PortfolioImage.id]",
+    )
 
+    @property
+    def image(self):
+        return image_metadata(self.image_url, self.image_public_id, self.image_width, self.image_height)
@@ -1,6 +1,7 @@
 from server.extension import db
 from sqlalchemy_serializer import SerializerMixin
 from datetime import datetime
+from server.helpers.images import image_metadata
 
 class Service(db.Model,SerializerMixin):
 
@@ -11,10 +12,18 @@ class Service(db.Model,SerializerMixin):
     description = db.Column(db.String,nullable=False)
     price =db.Column(db.Float,nullable=True)
     image_url = db.Column(db.String,nullable=True)
+    image_public_id = db.Column(db.String,nullable=True)
+    image_width = db.Column(db.Integer,nullable=True)
+    image_height = db.Column(db.Integer,nullable=True)
     alt_text = db.Column(db.String,nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
-    serialize_rules = ("-bookings.service",)
+    serialize_rules = ("-bookings.service", "image")
 
    
-    bookings = db.relationship("Booking", back_populates="service", cascade="all, delete-orphan")
\ No newline at end of file
+    bookings = db.relationship("Booking", back_populates="service", cascade="all, delete-orphan")
+
+    @property
+    def image(self):
+        return image_metadata(self.image_url, self.image_public_id, self.image_width, self.image_height)
@@ -1,4 +1,6 @@
 import json
+from datetime import datetime
+from sqlalchemy.dialects.postgresql import JSONB
 from server.extension import db
 
 
@@ -8,25 +10,18 @@ class SiteSetting(db.Model):
     id = db.Column(db.Integer, primary_key=True, default=1)
     whatsapp_number = db.Column(db.String(32), nullable=True)
     google_business_name = db.Column(db.String(255), nullable=True)
-    google_reviews_json = db.Column(db.Text, nullable=True)
+    # List of reviews in the shape of server.helpers.reviews.REVIEW_FIELDS.
+    google_reviews = db.Column(db.JSON().with_variant(JSONB(), "postgresql"), nullable=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     @classmethod
     def get_singleton(cls):
-        settings = cls.query.get(1)
-        if not settings:
-            settings = cls(id=1)
-            db.session.add(settings)
-            db.session.commit()
-        return settings
+        # The row is only written when settings are saved, so reads never
+        # insert; callers that save must add the returned object.
+        return db.session.get(cls, 1) or cls(id=1)
 
     def get_google_reviews(self):
-        if not self.google_reviews_json:
-            return []
-        try:
-            parsed = json.loads(self.google_reviews_json)
-            return parsed if isinstance(parsed, list) else []
-        except (TypeError, ValueError):
-            return []
+        return self.google_reviews if isinstance(self.google_reviews, list) else []
 
     def to_public_dict(self):
         return {
@@ -37,5 +32,7 @@ class SiteSetting(db.Model):
 
     def to_admin_dict(self):
         data = self.to_public_dict()
-        data["google_reviews_json"] = self.google_reviews_json or ""
+        # The admin form edits reviews as text.
+        reviews = self.get_google_reviews()
+        data["google_reviews_json"] = json.dumps(reviews, indent=2) if reviews else ""
         return data
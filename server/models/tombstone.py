@@ -0,0 +1,35 @@
+from datetime import datetime
+from sqlalchemy import event
+from server.extension import db
+
+
+class Tombstone(db.Model):
+    """Records a deleted row so incremental sync clients can drop it too."""
+
+    __tablename__ = "sync_tombstones"
+    __table_args__ = (
+        # Sync pages through tombstones by (deleted_at, id).
+        db.Index("ix_sync_tombstones_deleted_at_id", "deleted_at", "id"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    entity = db.Column(db.String(30), nullable=False)
+    entity_id = db.Column(db.Integer, nullable=False)
+    deleted_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+
+def record_tombstones(connection, entity, entity_ids):
+    """Insert tombstones for rows removed outside the ORM, e.g. bulk deletes."""
+    if not entity_ids:
+        return
+    now = datetime.utcnow()
+    connection.execute(
+        Tombstone.__table__.insert(),
+        [{"entity": entity, "entity_id": entity_id, "deleted_at": now} for entity_id in entity_ids],
+    )
+
+
+def track_deletes(model, entity):
+    @event.listens_for(model, "after_delete")
+    def _record_tombstone(mapper, connection, target):
+        record_tombstones(connection, entity, [target.id])
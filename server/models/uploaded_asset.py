@@ -0,0 +1,31 @@
+from datetime import datetime
+from server.extension import db
+
+
+class UploadedAsset(db.Model):
+    __tablename__ = "uploaded_assets"
+    __table_args__ = (
+        db.UniqueConstraint("storage", "content_hash", name="uq_uploaded_assets_storage_hash"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    storage = db.Column(db.String(20), nullable=False, default="cloudinary", server_default="cloudinary")
+    content_hash = db.Column(db.String(64), nullable=False)
+    secure_url = db.Column(db.String, nullable=False)
+    public_id = db.Column(db.String, nullable=True)
+    format = db.Column(db.String(20), nullable=True)
+    width = db.Column(db.Integer, nullable=True)
+    height = db.Column(db.Integer, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Last time an upload was deduplicated onto this asset; asset GC leaves
+    # recently reused assets alone until the request that reused them commits.
+    last_used_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=True)
+
+    def to_upload_result(self):
+        return {
+            "secure_url": self.secure_url,
+            "public_id": self.public_id,
+            "format": self.format,
+            "width": self.width,
+            "height": self.height,
+        }
@@ -1,6 +1,13 @@
 from server.extension import db
 from werkzeug.security import generate_password_hash,check_password_hash
 from sqlalchemy_serializer import SerializerMixin 
+from sqlalchemy.orm import validates
+from datetime import datetime
+
+
+def normalize_email(email):
+    return (email or "").strip().lower()
+
 
 class User(db.Model,SerializerMixin):
 
@@ -10,6 +17,9 @@ class User(db.Model,SerializerMixin):
     username = db.Column(db.String,nullable=False)
     email = db.Column(db.String,nullable=False)
     password_hash = db.Column(db.String,nullable=False)
+    updated_at = db.Column(
+        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True
+    )
 
     serialize_rules = ("-password_hash", "-assigned_bookings.assigned_user")
 
@@ -20,8 +30,26 @@ class User(db.Model,SerializerMixin):
     )
 
 
+    @validates("email")
+    def _normalize_email(self, key, email):
+        return normalize_email(email)
+
+    @classmethod
+    def find_by_email(cls, email):
+        # Matches the expression of uq_users_email_lower, so this is one
+        # index lookup on both Postgres and SQLite.
+        email = normalize_email(email)
+        if not email:
+            return None
+        return cls.query.filter(db.func.lower(cls.email) == email).first()
+
     def set_password(self,password):
         self.password_hash=generate_password_hash(password)
 
     def check_password(self,password):
-        return check_password_hash(self.password_hash,password)    
+        return check_password_hash(self.password_hash,password)
+
+
+# Emails are stored normalized; the index on lower(email) also keeps rows
+# written before that from differing only in case.
+db.Index("uq_users_email_lower", db.func.lower(User.email), unique=True)
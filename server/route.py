@@ -7,6 +7,12 @@ from server.controllers.settings import settings_bp
 from server.controllers.hardware import hardware_bp
 from server.controllers.users import users_bp
 from server.controllers.ai import ai_bp
+from server.controllers.uploads import uploads_bp
+from server.controllers.dashboard import dashboard_bp
+from server.controllers.sync import sync_bp
+from server.controllers.events import events_bp
+from server.controllers.inbox import inbox_bp
+from server.controllers.archive import archive_bp
 
 
 def register_routes(app):
@@ -19,3 +25,9 @@ def register_routes(app):
     app.register_blueprint(hardware_bp)
     app.register_blueprint(users_bp)
     app.register_blueprint(ai_bp)
+    app.register_blueprint(uploads_bp)
+    app.register_blueprint(dashboard_bp)
+    app.register_blueprint(sync_bp)
+    app.register_blueprint(events_bp)
+    app.register_blueprint(inbox_bp)
+    app.register_blueprint(archive_bp)
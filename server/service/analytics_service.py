@@ -0,0 +1,215 @@
+import logging
+from datetime import datetime, time, timedelta
+import click
+from sqlalchemy import event, func, select, text, union_all
+from sqlalchemy.orm import Session
+from server.extension import db
+from server.models import ArchivedRecord, Booking, Contact, DailyRollup
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_SOURCES = {
+    "booking": Booking,
+    "contact": Contact,
+}
+# archived_records.entity for each kind. Archived rows keep counting, so a
+# day rebuilt after part of it was archived keeps its totals.
+ROLLUP_ARCHIVE_ENTITIES = {
+    "booking": "bookings",
+    "contact": "contacts",
+}
+ROLLUP_STREAM_BATCH = 1000
+PENDING_DAYS_KEY = "rollup_days"
+
+
+def _rollup_status(kind, row):
+    if kind == "booking":
+        return row.status or "pending"
+    return "read" if row.is_read else "unread"
+
+
+def _rollup_columns(kind, table):
+    columns = [table.c.created_at, table.c.responded_at, table.c.is_read]
+    if kind == "booking":
+        columns += [table.c.service_id, table.c.status]
+    return columns
+
+
+def _rollup_rows(connection, kind, start, end):
+    table = ROLLUP_SOURCES[kind].__table__
+    archived = ArchivedRecord.__table__
+    hot = select(*_rollup_columns(kind, table)).where(
+        table.c.created_at >= start, table.c.created_at < end
+    )
+    cold = select(*_rollup_columns(kind, archived)).where(
+        archived.c.entity == ROLLUP_ARCHIVE_ENTITIES[kind],
+        archived.c.created_at >= start,
+        archived.c.created_at < end,
+    )
+    query = union_all(hot, cold).execution_options(yield_per=ROLLUP_STREAM_BATCH)
+    return connection.execute(query)
+
+
+def _day_ranges(days):
+    """Merge sorted dates into (start, end) datetime ranges of consecutive days."""
+    ranges = []
+    for day in days:
+        start = datetime.combine(day, time.min)
+        if ranges and ranges[-1][1] == start:
+            ranges[-1][1] = start + timedelta(days=1)
+        else:
+            ranges.append([start, start + timedelta(days=1)])
+    return ranges
+
+
+def _aggregate(kind, rows):
+    buckets = {}
+    for row in rows:
+        service_id = getattr(row, "service_id", None)
+        key = (row.created_at.date(), service_id, _rollup_status(kind, row))
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = {
+                "kind": kind,
+                "day": key[0],
+                "service_id": service_id,
+                "status": key[2],
+                "total": 0,
+                "responded": 0,
+                "response_seconds_total": 0.0,
+                "response_seconds_max": None,
+            }
+        bucket["total"] += 1
+        if row.responded_at is not None:
+            seconds = max((row.responded_at - row.created_at).total_seconds(), 0.0)
+            bucket["responded"] += 1
+            bucket["response_seconds_total"] += seconds
+            if bucket["response_seconds_max"] is None or seconds > bucket["response_seconds_max"]:
+                bucket["response_seconds_max"] = seconds
+    return list(buckets.values())
+
+
+def _lock_rollups(connection):
+    # Two workers refreshing the same day would both delete and then both
+    # insert; on Postgres serialize refreshes with a transaction lock.
+    # SQLite already serializes writers.
+    if connection.dialect.name == "postgresql":
+        connection.execute(text("SELECT pg_advisory_xact_lock(hashtext('daily_rollups'))"))
+
+
+def refresh_rollups(kind, days):
+    """Recompute the rollup rows of ``kind`` for each date in ``days``.
+
+    Runs on its own connection so it can be called after the session that
+    made the change has committed.
+    """
+    days = sorted(set(days))
+    if not days:
+        return 0
+
+    table = DailyRollup.__table__
+    with db.engine.begin() as connection:
+        _lock_rollups(connection)
+        buckets = []
+        for start, end in _day_ranges(days):
+            buckets.extend(_aggregate(kind, _rollup_rows(connection, kind, start, end)))
+            connection.execute(
+                table.delete().where(
+                    table.c.kind == kind,
+                    table.c.day >= start.date(),
+                    table.c.day < end.date(),
+                )
+            )
+
+        now = datetime.utcnow()
+        for bucket in buckets:
+            bucket["refreshed_at"] = now
+        if buckets:
+            connection.execute(table.insert(), buckets)
+    return len(buckets)
+
+
+def refresh_rollup_range(start_day, end_day):
+    """Recompute every kind for ``start_day`` through ``end_day`` inclusive."""
+    days = [start_day + timedelta(days=offset) for offset in range((end_day - start_day).days + 1)]
+    return {kind: refresh_rollups(kind, days) for kind in ROLLUP_SOURCES}
+
+
+def _model_kind(obj):
+    for kind, model in ROLLUP_SOURCES.items():
+        if isinstance(obj, model):
+            return kind
+    return None
+
+
+def _queue_days(session, kind, days):
+    pending = session.info.setdefault(PENDING_DAYS_KEY, {})
+    pending.setdefault(kind, set()).update(days)
+
+
+def queue_rollup_refresh(model, ids, session=None):
+    """Mark the days of rows changed outside the ORM, e.g. by a bulk UPDATE.
+
+    Call before the commit; the days are refreshed once it succeeds.
+    """
+    session = session or db.session
+    kind = next((name for name, source in ROLLUP_SOURCES.items() if source is model), None)
+    if kind is None or not ids:
+        return
+    created = session.query(model.created_at).filter(model.id.in_(ids)).distinct()
+    _queue_days(session, kind, {created_at.date() for (created_at,) in created if created_at})
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_rollup_days(session, flush_context):
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        kind = _model_kind(obj)
+        if kind is not None and obj.created_at is not None:
+            _queue_days(session, kind, {obj.created_at.date()})
+
+
+@event.listens_for(Session, "after_commit")
+def _refresh_pending_rollups(session):
+    pending = session.info.pop(PENDING_DAYS_KEY, None)
+    if not pending:
+        return
+    for kind, days in pending.items():
+        try:
+            refresh_rollups(kind, days)
+        except Exception as error:
+            # The write itself is committed; the scheduled refresh catches up.
+            logger.error("Refreshing %s rollups failed: %s", kind, error)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_rollups(session):
+    session.info.pop(PENDING_DAYS_KEY, None)
+
+
+@click.command("refresh-rollups")
+@click.option("--days", default=3, show_default=True, help="Number of recent days to recompute.")
+@click.option(
+    "--all",
+    "rebuild_all",
+    is_flag=True,
+    help="Recompute every day with data.",
+)
+def refresh_rollups_command(days, rebuild_all):
+    """Recompute the dashboard analytics rollups."""
+    end_day = datetime.utcnow().date()
+    start_day = end_day - timedelta(days=max(days, 1) - 1)
+
+    if rebuild_all:
+        earliest = [
+            db.session.query(func.min(model.created_at)).scalar()
+            for model in (*ROLLUP_SOURCES.values(), ArchivedRecord)
+        ]
+        earliest = [value.date() for value in earliest if value is not None]
+        if earliest:
+            start_day = min(earliest)
+
+    counts = refresh_rollup_range(start_day, end_day)
+    click.echo(
+        f"Refreshed rollups from {start_day} to {end_day}: "
+        + ", ".join(f"{count} {kind} rows" for kind, count in counts.items())
+    )
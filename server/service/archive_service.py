@@ -0,0 +1,125 @@
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+import click
+from sqlalchemy import and_, delete, or_
+from sqlalchemy.orm import joinedload
+from server.extension import db
+from server.models import ArchivedRecord, Booking, Contact
+from server.models.tombstone import record_tombstones
+from server.helpers.serializers import serialize_booking
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", "500"))
+# Bookings in these statuses, and contacts that have been read, are archived
+# once they are older than ARCHIVE_CLOSED_AFTER_DAYS.
+ARCHIVE_CLOSED_STATUSES = tuple(
+    status.strip()
+    for status in os.getenv("ARCHIVE_CLOSED_STATUSES", "confirmed,rejected").split(",")
+    if status.strip()
+)
+ARCHIVE_CLOSED_AFTER_DAYS = int(os.getenv("ARCHIVE_CLOSED_AFTER_DAYS", "180"))
+# Anything older than this is archived whatever its state.
+ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS", "730"))
+
+
+def _booking_candidates(closed_cutoff, age_cutoff):
+    return Booking.query.filter(
+        or_(
+            and_(Booking.status.in_(ARCHIVE_CLOSED_STATUSES), Booking.created_at < closed_cutoff),
+            Booking.created_at < age_cutoff,
+        )
+    ).options(joinedload(Booking.service), joinedload(Booking.assigned_user))
+
+
+def _contact_candidates(closed_cutoff, age_cutoff):
+    return Contact.query.filter(
+        or_(
+            and_(Contact.is_read.is_(True), Contact.created_at < closed_cutoff),
+            Contact.created_at < age_cutoff,
+        )
+    )
+
+
+ARCHIVE_ENTITIES = {
+    "bookings": (Booking, _booking_candidates, serialize_booking),
+    "contacts": (Contact, _contact_candidates, lambda contact: contact.to_dict()),
+}
+
+
+def _archive_batch(entity, candidates, batch_size):
+    model, _, serialize = ARCHIVE_ENTITIES[entity]
+    rows = candidates.order_by(model.created_at, model.id).limit(batch_size).all()
+    if not rows:
+        return 0
+
+    now = datetime.utcnow()
+    ids = [row.id for row in rows]
+    db.session.add_all([
+        ArchivedRecord(
+            entity=entity,
+            entity_id=row.id,
+            email=(row.email or "").strip().lower() or None,
+            created_at=row.created_at,
+            archived_at=now,
+            status=getattr(row, "status", None),
+            is_read=row.is_read,
+            responded_at=row.responded_at,
+            service_id=getattr(row, "service_id", None),
+            data=json.dumps(serialize(row)),
+        )
+        for row in rows
+    ])
+    db.session.execute(
+        delete(model).where(model.id.in_(ids)).execution_options(synchronize_session=False)
+    )
+    # A bulk DELETE skips the after_delete hook, so record tombstones here
+    # for sync clients.
+    record_tombstones(db.session.connection(), entity, ids)
+    db.session.commit()
+    # Drop the archived objects so a long run keeps a flat memory profile.
+    db.session.expunge_all()
+    return len(ids)
+
+
+def archive_records(batch_size=ARCHIVE_BATCH_SIZE, max_batches=None, dry_run=False, now=None):
+    """Move closed or old bookings and contacts into archived_records.
+
+    Each batch is its own transaction, so an interrupted run keeps the
+    batches it finished. Returns the number of rows per entity (the number
+    that would move when ``dry_run`` is set).
+    """
+    now = now or datetime.utcnow()
+    closed_cutoff = now - timedelta(days=ARCHIVE_CLOSED_AFTER_DAYS)
+    age_cutoff = now - timedelta(days=ARCHIVE_AFTER_DAYS)
+
+    moved = {}
+    for entity, (_, candidates, _) in ARCHIVE_ENTITIES.items():
+        query = candidates(closed_cutoff, age_cutoff)
+        if dry_run:
+            moved[entity] = query.order_by(None).count()
+            continue
+
+        moved[entity] = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            count = _archive_batch(entity, query, batch_size)
+            if not count:
+                break
+            moved[entity] += count
+            batches += 1
+            logger.info("Archived %s %s (%s so far)", count, entity, moved[entity])
+    return moved
+
+
+@click.command("archive-records")
+@click.option("--batch-size", default=ARCHIVE_BATCH_SIZE, show_default=True, type=click.IntRange(1, 5000))
+@click.option("--max-batches", default=None, type=click.IntRange(1), help="Stop after this many batches per table.")
+@click.option("--dry-run", is_flag=True, help="Only report how many rows would move.")
+def archive_records_command(batch_size, max_batches, dry_run):
+    """Move closed or old bookings and contacts into the archive."""
+    moved = archive_records(batch_size=batch_size, max_batches=max_batches, dry_run=dry_run)
+    verb = "Would archive" if dry_run else "Archived"
+    click.echo(f"{verb}: " + ", ".join(f"{count} {entity}" for entity, count in moved.items()))
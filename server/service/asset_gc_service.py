@@ -0,0 +1,159 @@
+import logging
+import os
+from datetime import datetime, timedelta
+import click
+from server.extension import db
+from server.models import HardwareItem, PortfolioImage, PortfolioItem, Service, UploadedAsset
+from server.service.cloudinary_service import public_id_from_url
+from server.service.storage_service import get_storage
+
+logger = logging.getLogger(__name__)
+
+ASSET_ROOT_FOLDER = "radam-construction"
+# Direct uploads land in storage before the form that uses them is saved.
+ASSET_GC_GRACE_PERIOD = timedelta(hours=int(os.getenv("ASSET_GC_GRACE_HOURS", "24")))
+ASSET_GC_BATCH_SIZE = 100
+DRY_RUN_SAMPLE_SIZE = 50
+
+# (public_id column, url column) for every table that points at an image.
+IMAGE_REFERENCES = (
+    (Service.image_public_id, Service.image_url),
+    (PortfolioItem.image_public_id, PortfolioItem.image_url),
+    (PortfolioImage.public_id, PortfolioImage.image_url),
+    (HardwareItem.image_public_id, HardwareItem.image_url),
+)
+
+
+def referenced_public_ids():
+    referenced = set()
+    for public_id_column, url_column in IMAGE_REFERENCES:
+        for public_id, url in db.session.query(public_id_column, url_column):
+            # Rows saved before public_id was stored are matched by URL.
+            public_id = public_id or public_id_from_url(url)
+            if public_id:
+                referenced.add(public_id)
+    return referenced
+
+
+def find_orphaned_assets(storage=None, now=None, grace_period=ASSET_GC_GRACE_PERIOD):
+    storage = storage or get_storage()
+    cutoff = (now or datetime.utcnow()) - grace_period
+    referenced = referenced_public_ids()
+
+    scanned = 0
+    orphans = []
+    for asset in storage.list_assets(ASSET_ROOT_FOLDER):
+        scanned += 1
+        if asset["public_id"] in referenced:
+            continue
+        if asset["created_at"] is not None and asset["created_at"] > cutoff:
+            continue
+        orphans.append(asset)
+    return scanned, len(referenced), orphans
+
+
+def _recently_reused(storage_name, public_ids, cutoff):
+    return {
+        public_id
+        for (public_id,) in db.session.query(UploadedAsset.public_id).filter(
+            UploadedAsset.storage == storage_name,
+            UploadedAsset.public_id.in_(public_ids),
+            UploadedAsset.last_used_at > cutoff,
+        )
+    }
+
+
+def _still_orphaned(storage_name, public_ids, grace_period):
+    """Re-check a batch right before deleting it.
+
+    The scan can take a while, and meanwhile a save may start pointing at an
+    asset or an upload may be deduplicated onto it.
+    """
+    live = referenced_public_ids() | _recently_reused(
+        storage_name, public_ids, datetime.utcnow() - grace_period
+    )
+    return [public_id for public_id in public_ids if public_id not in live]
+
+
+def _forget_uploaded_assets(storage_name, public_ids):
+    # The dedup table must not hand out URLs of deleted images.
+    UploadedAsset.query.filter(
+        UploadedAsset.storage == storage_name,
+        UploadedAsset.public_id.in_(public_ids),
+    ).delete(synchronize_session=False)
+    db.session.commit()
+
+
+def collect_asset_garbage(dry_run=False, batch_size=ASSET_GC_BATCH_SIZE, grace_period=ASSET_GC_GRACE_PERIOD):
+    """Delete stored images that no row references any more.
+
+    Returns a report dict; with ``dry_run`` nothing is deleted and the report
+    lists a sample of what would be.
+    """
+    storage = get_storage()
+    scanned, referenced, orphans = find_orphaned_assets(storage, grace_period=grace_period)
+    report = {
+        "storage": storage.name,
+        "scanned": scanned,
+        "referenced": referenced,
+        "orphaned": len(orphans),
+        "orphaned_bytes": sum(asset["bytes"] or 0 for asset in orphans),
+        "deleted": 0,
+        "skipped": 0,
+        "failed": 0,
+    }
+
+    if dry_run:
+        report["sample"] = [asset["public_id"] for asset in orphans[:DRY_RUN_SAMPLE_SIZE]]
+        return report
+
+    public_ids = [asset["public_id"] for asset in orphans]
+    for start in range(0, len(public_ids), batch_size):
+        batch = public_ids[start:start + batch_size]
+        batch = _still_orphaned(storage.name, batch, grace_period)
+        report["skipped"] += len(public_ids[start:start + batch_size]) - len(batch)
+        if not batch:
+            continue
+        try:
+            deleted = storage.delete_many(batch)
+        except Exception as e:
+            logger.error("Deleting orphaned assets failed: %s", e)
+            report["failed"] += len(batch)
+            continue
+        if deleted:
+            _forget_uploaded_assets(storage.name, deleted)
+        report["deleted"] += len(deleted)
+        report["failed"] += len(batch) - len(deleted)
+    return report
+
+
+@click.command("gc-assets")
+@click.option("--dry-run", is_flag=True, help="Report orphaned images without deleting them.")
+@click.option("--batch-size", default=ASSET_GC_BATCH_SIZE, show_default=True, type=click.IntRange(1, 100))
+@click.option(
+    "--grace-hours",
+    default=int(ASSET_GC_GRACE_PERIOD.total_seconds() // 3600),
+    show_default=True,
+    type=click.IntRange(0),
+    help="Skip images uploaded more recently than this.",
+)
+def gc_assets_command(dry_run, batch_size, grace_hours):
+    """Delete stored images that no service, portfolio or hardware row uses."""
+    report = collect_asset_garbage(
+        dry_run=dry_run, batch_size=batch_size, grace_period=timedelta(hours=grace_hours)
+    )
+    click.echo(
+        f"{report['storage']}: scanned {report['scanned']} images, "
+        f"{report['referenced']} referenced, {report['orphaned']} orphaned "
+        f"({report['orphaned_bytes'] / (1024 * 1024):.1f} MB)"
+    )
+    if dry_run:
+        for public_id in report["sample"]:
+            click.echo(f"  would delete {public_id}")
+        if report["orphaned"] > len(report["sample"]):
+            click.echo(f"  ... and {report['orphaned'] - len(report['sample'])} more")
+    else:
+        click.echo(
+            f"Deleted {report['deleted']}, skipped {report['skipped']} now in use, "
+            f"failed {report['failed']}"
+        )
@@ -1,49 +1,327 @@
 import cloudinary
-from cloudinary.uploader import upload
+from cloudinary.utils import api_sign_request, cloudinary_url
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import SpooledTemporaryFile
+from PIL import Image, ImageOps, UnidentifiedImageError
+from sqlalchemy.exc import IntegrityError
+from server.extension import db
+from server.models import UploadedAsset
+from server.service.storage_service import get_storage
+import hashlib
 import os
+from datetime import datetime
+import re
+import time
+from urllib.parse import urlparse
 import logging
 from dotenv import load_dotenv
 
 load_dotenv()
 
-cloudinary.config(
-    cloud_name=os.getenv("CLOUDINARY_CLOUD_NAME"),
-    api_key=os.getenv("CLOUDINARY_API_KEY"),
-    api_secret=os.getenv("CLOUDINARY_API_SECRET"),
-    secure=True
-)
-
 logger = logging.getLogger(__name__)
 
-def upload_files_to_cloudinary(files, folder="radam-construction"):
- 
-    if not isinstance(files, list):
-        files = [files]  
+# Upper bound on concurrent uploads per request, so a 20-photo portfolio post
+# does not open 20 connections at once.
+MAX_UPLOAD_WORKERS = int(os.getenv("CLOUDINARY_UPLOAD_WORKERS", "4"))
 
-    uploaded_results = []
+# Local resize before upload. Cloudinary limits images to 1200px anyway, so
+# shrinking phone photos here saves most of the upload time and bandwidth.
+PRERESIZE_ENABLED = os.getenv("IMAGE_PRERESIZE", "true").lower() not in ("0", "false", "no")
+PRERESIZE_MAX_DIMENSION = int(os.getenv("IMAGE_PRERESIZE_MAX_DIMENSION", "1200"))
+PRERESIZE_JPEG_QUALITY = int(os.getenv("IMAGE_PRERESIZE_QUALITY", "85"))
+# Re-encoded output stays in memory up to this size, then spills to disk.
+PRERESIZE_SPOOL_BYTES = 2 * 1024 * 1024
 
-    for file in files:
-        try:
-            result = upload(
-                file,
-                folder=folder,
-                resource_type="image",
-                overwrite=True,
-                transformation=[
-                    {"quality": "auto", "fetch_format": "auto", "width": 1200, "crop": "limit"}
-                ]
+HASH_CHUNK_BYTES = 64 * 1024
+
+
+def _file_stream(file):
+    return getattr(file, "stream", file)
+
+
+def prepare_image_for_upload(file):
+    """Downsize and re-encode an image with Pillow before it is uploaded.
+
+    Returns ``(payload, filename)``. ``payload`` is the original file when it
+    cannot be processed or is already small enough.
+    """
+    filename = getattr(file, "filename", None) or "image"
+    stream = _file_stream(file)
+    try:
+        stream.seek(0)
+        source = Image.open(stream)
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, ValueError, AttributeError):
+        if hasattr(stream, "seek"):
+            stream.seek(0)
+        return file, filename
+
+    try:
+        limit = (PRERESIZE_MAX_DIMENSION, PRERESIZE_MAX_DIMENSION)
+        original_size = source.size
+        already_small = source.width <= limit[0] and source.height <= limit[1]
+
+        # Animated images would lose their frames; let Cloudinary handle them.
+        if getattr(source, "is_animated", False) or already_small:
+            stream.seek(0)
+            return file, filename
+
+        # For JPEGs, draft() decodes at a reduced DCT scale, so a 12 MP photo is
+        # never fully expanded in memory.
+        source.draft("RGB", limit)
+        image = ImageOps.exif_transpose(source)
+        image.thumbnail(limit, Image.LANCZOS)
+
+        output = SpooledTemporaryFile(max_size=PRERESIZE_SPOOL_BYTES)
+        if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+            image.save(output, format="WEBP", quality=PRERESIZE_JPEG_QUALITY, method=4)
+            extension = "webp"
+        else:
+            image.convert("RGB").save(
+                output,
+                format="JPEG",
+                quality=PRERESIZE_JPEG_QUALITY,
+                optimize=True,
+                progressive=True,
             )
+            extension = "jpg"
+
+        output.seek(0)
+        logger.debug("Pre-resized %s from %s to %s", filename, original_size, image.size)
+        image.close()
+        return output, f"{os.path.splitext(filename)[0]}.{extension}"
+    except (OSError, ValueError) as e:
+        logger.warning("Pre-resize skipped for %s: %s", filename, e)
+        stream.seek(0)
+        return file, filename
+
+
+def _upload_one(file, folder):
+    if PRERESIZE_ENABLED:
+        payload, filename = prepare_image_for_upload(file)
+    else:
+        payload, filename = file, None
 
-            uploaded_results.append({
-                "secure_url": result.get("secure_url"),
-                "public_id": result.get("public_id"),
-                "format": result.get("format"),
-                "width": result.get("width"),
-                "height": result.get("height")
-            })
+    try:
+        return get_storage().upload(payload, folder, filename)
+    finally:
+        if payload is not file:
+            payload.close()
 
+
+def _cleanup_uploads(uploaded_results):
+    storage = get_storage()
+    for result in uploaded_results:
+        public_id = result.get("public_id")
+        if not public_id:
+            continue
+        try:
+            storage.delete(public_id)
         except Exception as e:
-            logger.error("Cloudinary upload failed for %s: %s", file.filename, e)
-            raise RuntimeError(f"Failed to upload {file.filename} to Cloudinary")
+            logger.error("Upload cleanup failed for %s: %s", public_id, e)
+
+
+def _hash_file(file):
+    stream = _file_stream(file)
+    digest = hashlib.sha256()
+    stream.seek(0)
+    for chunk in iter(lambda: stream.read(HASH_CHUNK_BYTES), b""):
+        digest.update(chunk)
+    stream.seek(0)
+    return digest.hexdigest()
+
+
+def _touch_assets(asset_ids):
+    # Committed on its own connection so asset GC sees the reuse right away,
+    # not only once the caller's transaction commits.
+    if not asset_ids:
+        return
+    with db.engine.begin() as connection:
+        connection.execute(
+            UploadedAsset.__table__.update()
+            .where(UploadedAsset.id.in_(asset_ids))
+            .values(last_used_at=datetime.utcnow())
+        )
+
+
+def _find_existing_assets(hashes):
+    assets = UploadedAsset.query.filter(
+        UploadedAsset.storage == get_storage().name,
+        UploadedAsset.content_hash.in_(hashes),
+    ).all()
+    _touch_assets([asset.id for asset in assets])
+    return {asset.content_hash: asset.to_upload_result() for asset in assets}
+
+
+def _record_assets(new_results):
+    storage_name = get_storage().name
+    for content_hash, result in new_results.items():
+        try:
+            # A concurrent request may have stored the same image first; the
+            # savepoint keeps that from failing the caller's transaction.
+            with db.session.begin_nested():
+                db.session.add(
+                    UploadedAsset(storage=storage_name, content_hash=content_hash, **result)
+                )
+        except IntegrityError:
+            logger.info("Uploaded asset %s was already recorded", content_hash)
+
+
+def upload_files_to_cloudinary(files, folder="radam-construction"):
+
+    if not isinstance(files, list):
+        files = [files]
+
+    if not files:
+        return []
+
+    # Identical images are uploaded once and then reused by content hash.
+    hashes = [_hash_file(file) for file in files]
+    known = _find_existing_assets(set(hashes))
+
+    pending = {}
+    for file, content_hash in zip(files, hashes):
+        if content_hash not in known and content_hash not in pending:
+            pending[content_hash] = file
+
+    new_results = {}
+    if pending:
+        workers = max(1, min(MAX_UPLOAD_WORKERS, len(pending)))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                content_hash: executor.submit(_upload_one, file, folder)
+                for content_hash, file in pending.items()
+            }
+
+        failed_file = None
+        for content_hash, future in futures.items():
+            file = pending[content_hash]
+            error = future.exception()
+            if error is None:
+                new_results[content_hash] = future.result()
+            else:
+                logger.error("Upload failed for %s: %s", file.filename, error)
+                if failed_file is None:
+                    failed_file = file
+
+        if failed_file is not None:
+            _cleanup_uploads(new_results.values())
+            raise RuntimeError(f"Failed to upload {failed_file.filename} to {get_storage().label}")
+
+        _record_assets(new_results)
+
+    # Results follow the order of the submitted files so the first file stays the cover.
+    results = {**known, **new_results}
+    return [dict(results[content_hash]) for content_hash in hashes]
+
+
+# Folders a client may upload into directly, keyed by the resource that owns them.
+DIRECT_UPLOAD_FOLDERS = {
+    "portfolio": "radam-construction/portfolio",
+    "services": "radam-construction/services",
+    "hardware": "radam-construction/hardware",
+}
+
+# Same incoming transformation as server-side uploads, in Cloudinary's string form.
+DIRECT_UPLOAD_TRANSFORMATION = "c_limit,f_auto,q_auto,w_1200"
+
+
+CLOUDINARY_UPLOAD_MARKER = "/image/upload/"
+CLOUDINARY_VERSION_SEGMENT = re.compile(r"(?:^|/)v\d+/(.+)$")
+CLOUDINARY_TRANSFORMATION_SEGMENT = re.compile(r"^[a-z]{1,3}_[^/]*$")
+
+
+def public_id_from_url(url):
+    """Recover the public_id from a Cloudinary delivery URL, or None."""
+    path = urlparse(url or "").path
+    if CLOUDINARY_UPLOAD_MARKER not in path:
+        return None
+
+    rest = path.split(CLOUDINARY_UPLOAD_MARKER, 1)[1]
+    versioned = CLOUDINARY_VERSION_SEGMENT.search(rest)
+    if versioned:
+        rest = versioned.group(1)
+    else:
+        segments = rest.split("/")
+        while len(segments) > 1 and CLOUDINARY_TRANSFORMATION_SEGMENT.match(segments[0]):
+            segments.pop(0)
+        rest = "/".join(segments)
+
+    return os.path.splitext(rest)[0] or None
+
+
+def generate_upload_signature(folder):
+    config = cloudinary.config()
+    if not config.cloud_name or not config.api_key or not config.api_secret:
+        raise RuntimeError("Cloudinary settings are not configured")
+
+    params = {
+        "folder": folder,
+        "timestamp": int(time.time()),
+        "transformation": DIRECT_UPLOAD_TRANSFORMATION,
+    }
+    signature = api_sign_request(params, config.api_secret)
+
+    return {
+        **params,
+        "signature": signature,
+        "api_key": config.api_key,
+        "cloud_name": config.cloud_name,
+        "upload_url": f"https://api.cloudinary.com/v1_1/{config.cloud_name}/image/upload",
+    }
+
+
+def _dimension(value):
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return None
+    return value if value > 0 else None
+
+
+def resolve_uploaded_images(entries, folder="radam-construction"):
+    """Validate direct-upload results sent by the client and return them in the
+    same shape as upload_files_to_cloudinary."""
+    if not isinstance(entries, list):
+        entries = [entries]
+
+    cloud_name = cloudinary.config().cloud_name
+    url_prefix = f"https://res.cloudinary.com/{cloud_name}/image/upload/"
+
+    resolved = []
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = {"secure_url": entry}
+        if not isinstance(entry, dict):
+            raise ValueError("Each image must be a URL or an object with public_id/secure_url")
+
+        public_id = (entry.get("public_id") or "").strip() or None
+        secure_url = (entry.get("secure_url") or "").strip() or None
+
+        if not public_id and not secure_url:
+            raise ValueError("Each image needs a public_id or secure_url")
+        if public_id and not public_id.startswith(f"{folder}/"):
+            raise ValueError(f"Image {public_id} is not in {folder}")
+        if secure_url:
+            if not secure_url.startswith(url_prefix):
+                raise ValueError("Image URL is not a Cloudinary upload for this account")
+            # The stored public_id decides what the asset GC keeps, so it
+            # must name the image the URL actually shows.
+            url_public_id = public_id_from_url(secure_url)
+            if not url_public_id or not url_public_id.startswith(f"{folder}/"):
+                raise ValueError(f"Image URL is not in {folder}")
+            if public_id and public_id != url_public_id:
+                raise ValueError(f"Image {public_id} does not match its URL")
+            public_id = url_public_id
+        else:
+            secure_url = cloudinary_url(public_id, secure=True, resource_type="image")[0]
+
+        resolved.append({
+            "secure_url": secure_url,
+            "public_id": public_id,
+            "format": entry.get("format"),
+            "width": _dimension(entry.get("width")),
+            "height": _dimension(entry.get("height"))
+        })
 
-    return uploaded_results
+    return resolved
@@ -0,0 +1,155 @@
+import json
+import logging
+import os
+import queue
+import select
+import threading
+import time
+from datetime import datetime
+from sqlalchemy import text
+from server.extension import db
+
+logger = logging.getLogger(__name__)
+
+EVENT_BROKER = os.getenv("EVENT_BROKER", "memory").strip().lower()
+EVENT_CHANNEL = "radam_admin_events"
+SUBSCRIBER_QUEUE_SIZE = 100
+# Postgres rejects NOTIFY payloads of 8000 bytes or more.
+MAX_NOTIFY_PAYLOAD = 7900
+LISTENER_RETRY_MIN_SECONDS = 1
+LISTENER_RETRY_MAX_SECONDS = 30
+
+
+class InProcessBroker:
+    """Fans events out to the SSE streams open in this process."""
+
+    def __init__(self):
+        self._subscribers = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self):
+        subscriber = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def deliver(self, event):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(event)
+            except queue.Full:
+                # A stalled dashboard must not block the request that published.
+                logger.warning("Dropping event for a slow SSE subscriber")
+
+    def publish(self, event):
+        self.deliver(event)
+
+
+class PostgresBroker(InProcessBroker):
+    """Uses LISTEN/NOTIFY so every gunicorn worker sees every event.
+
+    publish() only sends a NOTIFY; a background thread per process LISTENs and
+    hands notifications to the local subscribers.
+    """
+
+    def __init__(self, engine):
+        super().__init__()
+        self._engine = engine
+        self._listener = None
+        self._listener_lock = threading.Lock()
+        self._listening = False
+
+    def publish(self, event):
+        payload = json.dumps(event)
+        if len(payload.encode()) > MAX_NOTIFY_PAYLOAD:
+            payload = json.dumps({"type": event["type"], "data": {"id": event["data"].get("id")}})
+
+        with self._engine.connect() as connection:
+            connection.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": EVENT_CHANNEL, "payload": payload},
+            )
+            connection.commit()
+
+    def subscribe(self):
+        self._ensure_listener()
+        return super().subscribe()
+
+    def _ensure_listener(self):
+        with self._listener_lock:
+            if self._listener and self._listener.is_alive():
+                return
+            self._listener = threading.Thread(target=self._listen, name="pg-event-listener", daemon=True)
+            self._listener.start()
+
+    def _listen(self):
+        # Runs for the life of the process: a dropped connection is retried
+        # with backoff so open streams keep receiving events.
+        delay = LISTENER_RETRY_MIN_SECONDS
+        while True:
+            self._listening = False
+            try:
+                self._listen_once()
+            except Exception as error:
+                if self._listening:
+                    # The connection worked for a while; start over quickly.
+                    delay = LISTENER_RETRY_MIN_SECONDS
+                logger.error("Postgres event listener failed, retrying in %ss: %s", delay, error)
+                time.sleep(delay)
+                delay = min(delay * 2, LISTENER_RETRY_MAX_SECONDS)
+
+    def _listen_once(self):
+        connection = self._engine.raw_connection()
+        try:
+            listener = connection.driver_connection
+            listener.set_isolation_level(0)  # autocommit, required for LISTEN
+            listener.cursor().execute(f"LISTEN {EVENT_CHANNEL}")
+            self._listening = True
+            logger.info("Postgres event listener connected")
+            while True:
+                if select.select([listener], [], [], 30) == ([], [], []):
+                    continue
+                listener.poll()
+                while listener.notifies:
+                    notification = listener.notifies.pop(0)
+                    try:
+                        self.deliver(json.loads(notification.payload))
+                    except ValueError:
+                        logger.warning("Ignoring malformed event payload")
+        finally:
+            connection.close()
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    with _broker_lock:
+        if _broker is None:
+            if EVENT_BROKER == "postgres":
+                _broker = PostgresBroker(db.engine)
+            else:
+                _broker = InProcessBroker()
+        return _broker
+
+
+def publish_event(event_type, data):
+    event = {
+        "type": event_type,
+        "data": data,
+        "sent_at": datetime.utcnow().isoformat(),
+    }
+    try:
+        get_broker().publish(event)
+    except Exception as error:
+        # Live updates are best effort; the write that triggered them has
+        # already been committed.
+        logger.error("Publishing %s failed: %s", event_type, error)
@@ -0,0 +1,88 @@
+import hashlib
+import json
+import os
+from datetime import datetime, timedelta
+from server.extension import db
+from server.models import IdempotencyRecord
+
+# How long a client-supplied Idempotency-Key is honoured.
+IDEMPOTENCY_KEY_TTL = timedelta(hours=int(os.getenv("IDEMPOTENCY_KEY_TTL_HOURS", "24")))
+# Without a key, an identical body within this window counts as a retry.
+CONTENT_DEDUP_WINDOW = timedelta(seconds=int(os.getenv("IDEMPOTENCY_CONTENT_WINDOW_SECONDS", "120")))
+MAX_KEY_LENGTH = 200
+
+KEY_PREFIX = "key:"
+CONTENT_PREFIX = "content:"
+
+
+def request_fingerprint(data):
+    payload = json.dumps(data or {}, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class IdempotentRequest:
+    """Replays the stored response of a POST that was already handled.
+
+    Usage: call replay() first and return its result if there is one;
+    otherwise create the row, flush, call remember() with the response and
+    commit. If the commit hits the unique constraint, a concurrent retry won
+    the race: roll back and call replay() again.
+    """
+
+    def __init__(self, scope, data, header_key=None):
+        header_key = (header_key or "").strip()
+        if len(header_key) > MAX_KEY_LENGTH:
+            raise ValueError(f"Idempotency-Key must be at most {MAX_KEY_LENGTH} characters")
+
+        self.scope = scope
+        self.fingerprint = request_fingerprint(data)
+        if header_key:
+            self.key = KEY_PREFIX + header_key
+            self.ttl = IDEMPOTENCY_KEY_TTL
+        else:
+            self.key = CONTENT_PREFIX + self.fingerprint
+            self.ttl = CONTENT_DEDUP_WINDOW
+
+    def _record(self):
+        return IdempotencyRecord.query.filter_by(scope=self.scope, key=self.key).first()
+
+    def _expired(self, record, now=None):
+        return record.created_at < (now or datetime.utcnow()) - self.ttl
+
+    def replay(self):
+        """Return ``(body, status, headers)`` for a retry, or None for a new request."""
+        record = self._record()
+        if record is None or self._expired(record):
+            return None
+        if record.fingerprint != self.fingerprint:
+            raise ValueError("Idempotency-Key was already used for a different request")
+        return (
+            json.loads(record.response_body),
+            record.status_code,
+            {"Idempotent-Replayed": "true"},
+        )
+
+    def remember(self, body, status_code):
+        """Stage the response in the caller's transaction."""
+        now = datetime.utcnow()
+        # Drop this key's expired record so it can be reused, and prune
+        # everything past the longest TTL while we are here.
+        IdempotencyRecord.query.filter(
+            IdempotencyRecord.scope == self.scope,
+            db.or_(
+                db.and_(
+                    IdempotencyRecord.key == self.key,
+                    IdempotencyRecord.created_at < now - self.ttl,
+                ),
+                IdempotencyRecord.created_at < now - IDEMPOTENCY_KEY_TTL,
+            ),
+        ).delete(synchronize_session=False)
+
+        db.session.add(IdempotencyRecord(
+            scope=self.scope,
+            key=self.key,
+            fingerprint=self.fingerprint,
+            status_code=status_code,
+            response_body=json.dumps(body),
+            created_at=now,
+        ))
@@ -17,8 +17,8 @@ def _get_resend_config():
 
 def _get_whatsapp_number():
     try:
-        from server.models import SiteSetting
-        return SiteSetting.get_singleton().whatsapp_number
+        from server.service.settings_service import get_settings
+        return get_settings().whatsapp_number
     except Exception:
         return None
 
@@ -0,0 +1,93 @@
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from server.extension import db
+from server.helpers.reviews import REVIEW_SORTS, sort_reviews
+from server.models import SiteSetting
+
+# How often a worker asks the database whether another worker saved new
+# settings. Saves made by this worker are picked up immediately.
+SETTINGS_VERSION_CHECK_SECONDS = float(os.getenv("SETTINGS_VERSION_CHECK_SECONDS", "5"))
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    """Read-only copy of the site settings row, with reviews pre-sorted."""
+
+    version: object = None
+    whatsapp_number: str = None
+    google_business_name: str = None
+    google_reviews: tuple = ()
+    # Reviews in every supported order, sorted once per snapshot.
+    sorted_reviews: MappingProxyType = field(default_factory=lambda: MappingProxyType({}))
+
+    @classmethod
+    def from_model(cls, settings):
+        if settings is None:
+            return cls()
+        reviews = tuple(MappingProxyType(dict(review)) for review in settings.get_google_reviews())
+        return cls(
+            version=settings.updated_at,
+            whatsapp_number=settings.whatsapp_number,
+            google_business_name=settings.google_business_name,
+            google_reviews=reviews,
+            sorted_reviews=MappingProxyType(
+                {sort: tuple(sort_reviews(reviews, sort)) for sort in REVIEW_SORTS}
+            ),
+        )
+
+    def reviews(self, sort="default", limit=None):
+        reviews = self.sorted_reviews.get(sort, self.google_reviews)
+        if limit is not None:
+            reviews = reviews[:limit]
+        return [dict(review) for review in reviews]
+
+    def to_public_dict(self, sort="default", limit=None):
+        return {
+            "whatsapp_number": self.whatsapp_number,
+            "google_business_name": self.google_business_name,
+            "google_reviews": self.reviews(sort, limit),
+            "google_reviews_total": len(self.google_reviews),
+        }
+
+
+_lock = threading.Lock()
+_snapshot = None
+_checked_at = 0.0
+
+
+def _current_version():
+    return db.session.query(SiteSetting.updated_at).filter(SiteSetting.id == 1).scalar()
+
+
+def _store(snapshot):
+    global _snapshot, _checked_at
+    with _lock:
+        _snapshot = snapshot
+        _checked_at = time.monotonic()
+    return snapshot
+
+
+def get_settings():
+    """Return the cached settings snapshot, reloading it if it went stale.
+
+    Each gunicorn worker keeps its own copy; at most every
+    SETTINGS_VERSION_CHECK_SECONDS it compares the row's updated_at with the
+    cached version and reloads only when they differ. A missing row is
+    cached as empty settings and never inserted on this read path.
+    """
+    snapshot = _snapshot
+    if snapshot is not None and time.monotonic() - _checked_at < SETTINGS_VERSION_CHECK_SECONDS:
+        return snapshot
+
+    if snapshot is not None and _current_version() == snapshot.version:
+        return _store(snapshot)
+
+    return _store(SettingsSnapshot.from_model(db.session.get(SiteSetting, 1)))
+
+
+def refresh_settings(settings):
+    """Replace this worker's snapshot after ``settings`` was committed."""
+    return _store(SettingsSnapshot.from_model(settings))
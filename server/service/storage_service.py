@@ -0,0 +1,236 @@
+import cloudinary
+import cloudinary.api
+from cloudinary.uploader import upload, destroy
+from PIL import Image, UnidentifiedImageError
+import hashlib
+import os
+import shutil
+import logging
+from datetime import datetime
+from dotenv import load_dotenv
+
+load_dotenv()
+
+cloudinary.config(
+    cloud_name=os.getenv("CLOUDINARY_CLOUD_NAME"),
+    api_key=os.getenv("CLOUDINARY_API_KEY"),
+    api_secret=os.getenv("CLOUDINARY_API_SECRET"),
+    secure=True
+)
+
+logger = logging.getLogger(__name__)
+
+MEDIA_STORAGE_BACKEND = os.getenv("MEDIA_STORAGE_BACKEND", "cloudinary").strip().lower()
+MEDIA_LOCAL_ROOT = os.getenv(
+    "MEDIA_LOCAL_ROOT",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "instance", "media"),
+)
+MEDIA_LOCAL_BASE_URL = os.getenv("MEDIA_LOCAL_BASE_URL", "/media").rstrip("/")
+
+COPY_CHUNK_BYTES = 64 * 1024
+
+
+class MediaStorage:
+    """Where uploaded images end up. Every backend returns the same result
+    shape: secure_url, public_id, format, width and height."""
+
+    name = None
+    label = None
+
+    def upload(self, file, folder, filename=None):
+        raise NotImplementedError
+
+    def delete(self, public_id):
+        raise NotImplementedError
+
+    def list_assets(self, prefix):
+        """Yield every stored image under ``prefix`` as a dict with
+        public_id, created_at (naive UTC) and bytes."""
+        raise NotImplementedError
+
+    def delete_many(self, public_ids):
+        """Delete several images and return the public_ids that are gone."""
+        deleted = []
+        for public_id in public_ids:
+            try:
+                self.delete(public_id)
+                deleted.append(public_id)
+            except Exception as e:
+                logger.error("Deleting %s failed: %s", public_id, e)
+        return deleted
+
+
+class CloudinaryStorage(MediaStorage):
+    name = "cloudinary"
+    label = "Cloudinary"
+
+    def upload(self, file, folder, filename=None):
+        options = {"filename": filename} if filename else {}
+        result = upload(
+            file,
+            folder=folder,
+            resource_type="image",
+            overwrite=True,
+            transformation=[
+                {"quality": "auto", "fetch_format": "auto", "width": 1200, "crop": "limit"}
+            ],
+            **options
+        )
+
+        return {
+            "secure_url": result.get("secure_url"),
+            "public_id": result.get("public_id"),
+            "format": result.get("format"),
+            "width": result.get("width"),
+            "height": result.get("height")
+        }
+
+    def delete(self, public_id):
+        destroy(public_id, resource_type="image")
+
+    # Admin API limits: 500 resources per listing page, 100 ids per delete.
+    LIST_PAGE_SIZE = 500
+    DELETE_BATCH_SIZE = 100
+
+    def list_assets(self, prefix):
+        next_cursor = None
+        while True:
+            options = {"next_cursor": next_cursor} if next_cursor else {}
+            page = cloudinary.api.resources(
+                type="upload",
+                resource_type="image",
+                prefix=prefix,
+                max_results=self.LIST_PAGE_SIZE,
+                **options
+            )
+            for resource in page.get("resources", []):
+                created_at = resource.get("created_at")
+                yield {
+                    "public_id": resource["public_id"],
+                    "created_at": (
+                        datetime.strptime(created_at, "%Y-%m-%dT%H:%M:%SZ") if created_at else None
+                    ),
+                    "bytes": resource.get("bytes") or 0,
+                }
+            next_cursor = page.get("next_cursor")
+            if not next_cursor:
+                return
+
+    def delete_many(self, public_ids):
+        deleted = []
+        public_ids = list(public_ids)
+        for start in range(0, len(public_ids), self.DELETE_BATCH_SIZE):
+            batch = public_ids[start:start + self.DELETE_BATCH_SIZE]
+            result = cloudinary.api.delete_resources(batch, resource_type="image", type="upload")
+            for public_id, status in (result.get("deleted") or {}).items():
+                if status in ("deleted", "not_found"):
+                    deleted.append(public_id)
+                else:
+                    logger.error("Cloudinary did not delete %s: %s", public_id, status)
+        return deleted
+
+
+class LocalStorage(MediaStorage):
+    """Stores images on disk under MEDIA_LOCAL_ROOT.
+
+    The public_id is derived from the folder and the content hash, so the same
+    bytes always map to the same URL. Used for offline runs and load tests.
+    """
+
+    name = "local"
+    label = "local storage"
+
+    def __init__(self, root=MEDIA_LOCAL_ROOT, base_url=MEDIA_LOCAL_BASE_URL):
+        self.root = root
+        self.base_url = base_url
+
+    def _path(self, public_id):
+        path = os.path.abspath(os.path.join(self.root, public_id))
+        if not path.startswith(os.path.abspath(self.root) + os.sep):
+            raise ValueError(f"Invalid public_id {public_id}")
+        return path
+
+    def upload(self, file, folder, filename=None):
+        stream = getattr(file, "stream", file)
+        stream.seek(0)
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: stream.read(COPY_CHUNK_BYTES), b""):
+            digest.update(chunk)
+        stream.seek(0)
+
+        width = height = image_format = None
+        try:
+            with Image.open(stream) as image:
+                width, height = image.size
+                image_format = (image.format or "").lower() or None
+        except (UnidentifiedImageError, OSError, ValueError):
+            pass
+        stream.seek(0)
+
+        name = filename or getattr(file, "filename", None) or ""
+        extension = (image_format or os.path.splitext(name)[1].lstrip(".") or "bin").lower()
+        extension = "jpg" if extension == "jpeg" else extension
+
+        public_id = f"{folder.strip('/')}/{digest.hexdigest()[:32]}"
+        path = self._path(f"{public_id}.{extension}")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as target:
+            shutil.copyfileobj(stream, target, COPY_CHUNK_BYTES)
+        stream.seek(0)
+
+        return {
+            "secure_url": f"{self.base_url}/{public_id}.{extension}",
+            "public_id": public_id,
+            "format": extension,
+            "width": width,
+            "height": height
+        }
+
+    def delete(self, public_id):
+        directory = os.path.dirname(self._path(public_id))
+        prefix = os.path.basename(public_id) + "."
+        if not os.path.isdir(directory):
+            return
+        for entry in os.listdir(directory):
+            if entry.startswith(prefix):
+                os.remove(os.path.join(directory, entry))
+
+    def list_assets(self, prefix):
+        top = self._path(prefix.strip("/"))
+        for directory, _, files in os.walk(top):
+            for entry in files:
+                path = os.path.join(directory, entry)
+                relative = os.path.relpath(path, self.root).replace(os.sep, "/")
+                stat = os.stat(path)
+                yield {
+                    "public_id": os.path.splitext(relative)[0],
+                    "created_at": datetime.utcfromtimestamp(stat.st_mtime),
+                    "bytes": stat.st_size,
+                }
+
+
+STORAGE_BACKENDS = {
+    CloudinaryStorage.name: CloudinaryStorage,
+    LocalStorage.name: LocalStorage,
+}
+
+_storage = None
+
+
+def get_storage():
+    global _storage
+    if _storage is None:
+        backend = STORAGE_BACKENDS.get(MEDIA_STORAGE_BACKEND)
+        if backend is None:
+            raise RuntimeError(
+                f"Unknown MEDIA_STORAGE_BACKEND {MEDIA_STORAGE_BACKEND!r}; "
+                f"expected one of: {', '.join(sorted(STORAGE_BACKENDS))}"
+            )
+        _storage = backend()
+    return _storage
+
+
+def set_storage(storage):
+    """Swap the active backend, e.g. for a benchmark run."""
+    global _storage
+    _storage = storage
@@ -0,0 +1,28 @@
+import os
+from datetime import datetime, timedelta
+import click
+from server.extension import db
+from server.models import Tombstone
+
+# Tombstones older than this are pruned. A client whose deletions cursor is
+# older may have missed some of them and is told to resync from scratch.
+TOMBSTONE_RETENTION = timedelta(days=int(os.getenv("TOMBSTONE_RETENTION_DAYS", "30")))
+
+
+def tombstone_cutoff(now=None):
+    return (now or datetime.utcnow()) - TOMBSTONE_RETENTION
+
+
+def prune_tombstones(now=None):
+    """Delete tombstones past the retention window; returns how many."""
+    deleted = Tombstone.query.filter(Tombstone.deleted_at < tombstone_cutoff(now)).delete(
+        synchronize_session=False
+    )
+    db.session.commit()
+    return deleted
+
+
+@click.command("prune-tombstones")
+def prune_tombstones_command():
+    """Delete sync tombstones older than TOMBSTONE_RETENTION_DAYS."""
+    click.echo(f"Pruned {prune_tombstones()} tombstones")